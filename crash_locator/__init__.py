@@ -1,3 +1,10 @@
-from beartype.claw import beartype_this_package
+import os
 
-beartype_this_package()
+# Runtime type checking wraps every call in the package, so it is opt-in.
+# Set BEARTYPE_CRASH_LOCATOR=1 in the process environment during development;
+# `python -O` strips it. It is read before `Config` and is not a setting, so it
+# can not go in `.env` and deliberately avoids the `crash_locator_` prefix.
+if __debug__ and os.getenv("BEARTYPE_CRASH_LOCATOR", "0") == "1":
+    from beartype.claw import beartype_this_package
+
+    beartype_this_package()
@@ -1,15 +1,51 @@
 from pathlib import Path
-import json
 from datetime import datetime
+import atexit
+import multiprocessing.util
+import os
 import logging.config
+import logging.handlers
+import queue
 from crash_locator.types.llm import APIType, ReasoningEffort
 from crash_locator.my_types import RunStatistic
 import asyncio
 import logging
 from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from cachier import set_default_params
-from typing import Optional, Dict, Any
+from typing import ClassVar, Final, Optional, Dict, Any
+from collections.abc import Mapping
+from types import MappingProxyType
+from functools import cached_property, lru_cache
+from contextvars import ContextVar
+
+
+# Repository root, the default location of the Data directory
+_ROOT_DIR: Final[Path] = Path(__file__).resolve().parent.parent
+
+# Date of this process run, used as the default result directory name
+_TODAY = datetime.now().strftime("%Y%m%d")
+
+
+PRESET_CONFIGS: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        "baseline": MappingProxyType(
+            {
+                "enable_extract_constraint": False,
+                "enable_notes": False,
+                "enable_candidate_reason": False,
+                "enable_candidate_correction": False,
+            }
+        ),
+        "full": MappingProxyType(
+            {
+                "enable_extract_constraint": True,
+                "enable_notes": True,
+                "enable_candidate_reason": True,
+                "enable_candidate_correction": True,
+            }
+        ),
+    }
+)
 
 
 class Config(BaseSettings):
@@ -25,13 +61,13 @@ class Config(BaseSettings):
     enable_candidate_correction: bool
     reasoning_effort: ReasoningEffort | None = None
 
-    root_dir: Path = Path(__file__).parent.parent
+    root_dir: Path = _ROOT_DIR
 
-    @property
+    @cached_property
     def data_dir(self) -> Path:
         return self.root_dir / "Data"
 
-    @property
+    @cached_property
     def cache_dir(self) -> Path:
         return self.data_dir / "cache"
 
@@ -41,177 +77,317 @@ class Config(BaseSettings):
     openai_api_type: APIType = APIType.RESPONSE
 
     # Pre_check directory
-    @property
+    @cached_property
     def pre_check_dir(self) -> Path:
         return self.data_dir / "pre_check"
 
-    @property
+    @cached_property
     def pre_check_statistic_path(self) -> Path:
         return self.pre_check_dir / "statistic.json"
 
-    @property
+    @cached_property
     def pre_check_reports_dir(self) -> Path:
         return self.pre_check_dir / "reports"
 
+    PRE_CHECK_REPORT_INFO_NAME: ClassVar[str] = "report_info.json"
+
+    def pre_check_report_dir(self, report_name: str) -> Path:
+        return _report_dir(self.pre_check_reports_dir, report_name)
+
     def pre_check_report_info_path(self, report_name: str) -> Path:
-        return self.pre_check_reports_dir / report_name / "report_info.json"
+        return _pre_check_report_info_path(self.pre_check_reports_dir, report_name)
 
     # Result directory
-    result_dir_name: str = Field(
-        default_factory=lambda: datetime.now().strftime("%Y%m%d")
-    )
+    result_dir_name: str = _TODAY
 
-    @property
+    @cached_property
     def result_dir(self) -> Path:
         return self.data_dir / "results" / self.result_dir_name
 
-    @property
+    @cached_property
     def result_statistic_path(self) -> Path:
         return self.result_dir / "statistic.json"
 
+    @cached_property
+    def result_reports_dir(self) -> Path:
+        return self.result_dir / "reports"
+
     def result_report_dir(self, report_name: str) -> Path:
-        return self.result_dir / "reports" / report_name
+        return _report_dir(self.result_reports_dir, report_name)
 
     def result_report_filter_dir(self, report_name: str) -> Path:
-        return self.result_report_dir(report_name) / "filter"
+        return _result_report_sub_dir(self.result_reports_dir, report_name, "filter")
 
     def result_report_constraint_dir(self, report_name: str) -> Path:
-        return self.result_report_dir(report_name) / "constraint"
+        return _result_report_sub_dir(
+            self.result_reports_dir, report_name, "constraint"
+        )
+
+    def ensure_run_dirs(self) -> None:
+        """Create the result directory tree shared by every report of a run."""
+        self.result_reports_dir.mkdir(parents=True, exist_ok=True)
 
     max_workers: int = 4
+    # Worker processes used by pre-check, which is CPU bound
+    pre_check_max_workers: int = os.cpu_count() or 1
+    max_llm_requests: int = 16
     retry_failed_reports: bool = True
 
     debug: bool = False
+    # Mirror log records to stdout in addition to the log file
+    verbose: bool = True
     debug_crash_reports: list[str] = Field(default_factory=list)
     debug_pre_check_reports: list[str] = Field(default_factory=list)
 
     resources_dir_name: str = "resources"
 
-    @property
+    @cached_property
     def resources_dir(self) -> Path:
         return self.data_dir / self.resources_dir_name
 
     # Crash reports directory
     crash_reports_dir_name: str = "all-0427"
 
-    @property
+    @cached_property
     def crash_reports_dir(self) -> Path:
         return self.resources_dir / "crash_reports" / self.crash_reports_dir_name
 
     def crash_report_path(self, report_name: str) -> Path:
-        return self.crash_reports_dir / report_name / f"{report_name}.json"
+        return _crash_report_path(self.crash_reports_dir, report_name)
 
-    def android_code_dir(self, v: str) -> list[Path]:
-        base_dir = (
-            self.resources_dir
-            / "android_code"
-            / f"platform_frameworks_base-android-{v}_r1"
-        )
-        return [
-            base_dir / "core" / "java",
-            base_dir / "location" / "java",
-        ]
+    def android_code_dir(self, v: str) -> tuple[Path, ...]:
+        return _android_code_dir(self.resources_dir, v)
 
     def android_support_code_dir(self) -> Path:
-        return self.resources_dir / "android_support_code" / "src"
+        return _android_support_code_dir(self.resources_dir)
+
+    def android_code_dir_str(self, v: str) -> tuple[str, ...]:
+        return _android_code_dir_str(self.resources_dir, v)
+
+    def android_support_code_dir_str(self) -> str:
+        return _android_support_code_dir_str(self.resources_dir)
 
     def application_manifest_path(self, apk_name: str) -> Path:
-        return (
-            self.resources_dir
-            / "application_code"
-            / apk_name
-            / "resources"
-            / "AndroidManifest.xml"
-        )
+        return _application_manifest_path(self.resources_dir, apk_name)
 
     def application_strings_path(self, apk_name: str) -> Path:
-        return (
-            self.resources_dir
-            / "application_code"
-            / apk_name
-            / "resources"
-            / "res"
-            / "values"
-            / "strings.xml"
-        )
+        return _application_strings_path(self.resources_dir, apk_name)
 
     def application_code_dir(self, apk_name: str) -> Path:
-        return self.resources_dir / "application_code" / apk_name / "sources"
+        return _application_code_dir(self.resources_dir, apk_name)
+
+    def application_code_dir_str(self, apk_name: str) -> str:
+        return _application_code_dir_str(self.resources_dir, apk_name)
 
     def android_cg_path(self, v: str) -> Path:
-        return self.resources_dir / "android_cg" / f"android{v}" / f"android{v}_cg.txt"
+        return _android_cg_path(self.resources_dir, v)
 
     def apk_cg_path(self, apk_name: str) -> Path:
-        return self.resources_dir / "apk_cg" / apk_name / f"{apk_name}_cg.txt"
+        return _apk_cg_path(self.resources_dir, apk_name)
 
     @model_validator(mode="before")
     @classmethod
     def apply_preset_config(cls, values: Dict[str, Any]) -> Dict[str, Any]:
-        PRESET_CONFIGS = {
-            "baseline": {
-                "enable_extract_constraint": False,
-                "enable_notes": False,
-                "enable_candidate_reason": False,
-                "enable_candidate_correction": False,
-            },
-            "full": {
-                "enable_extract_constraint": True,
-                "enable_notes": True,
-                "enable_candidate_reason": True,
-                "enable_candidate_correction": True,
-            },
-        }
-
         preset = values.get("preset")
-        if preset:
-            if preset not in PRESET_CONFIGS:
-                available = list(PRESET_CONFIGS.keys())
-                raise ValueError(
-                    f"Unknown preset '{preset}'. Available presets: {available}"
-                )
+        if not preset:
+            return values
 
-            preset_config = PRESET_CONFIGS[preset]
+        preset_config = PRESET_CONFIGS.get(preset)
+        if preset_config is None:
+            available = list(PRESET_CONFIGS.keys())
+            raise ValueError(
+                f"Unknown preset '{preset}'. Available presets: {available}"
+            )
 
-            for key, preset_value in preset_config.items():
-                if values.get(key) is None:
-                    values[key] = preset_value
+        for key, preset_value in preset_config.items():
+            if values.get(key) is None:
+                values[key] = preset_value
 
         return values
 
 
+# Path builders are pure functions of the root directory and a report, apk or
+# android version name, so the built paths are cached at module level where the
+# arguments are hashable.
+@lru_cache(maxsize=10000)
+def _report_dir(reports_dir: Path, report_name: str) -> Path:
+    return reports_dir / report_name
+
+
+@lru_cache(maxsize=10000)
+def _pre_check_report_info_path(pre_check_reports_dir: Path, report_name: str) -> Path:
+    return (
+        _report_dir(pre_check_reports_dir, report_name)
+        / Config.PRE_CHECK_REPORT_INFO_NAME
+    )
+
+
+@lru_cache(maxsize=10000)
+def _result_report_sub_dir(reports_dir: Path, report_name: str, sub_dir: str) -> Path:
+    return _report_dir(reports_dir, report_name) / sub_dir
+
+
+@lru_cache(maxsize=10000)
+def _crash_report_path(crash_reports_dir: Path, report_name: str) -> Path:
+    return crash_reports_dir / report_name / f"{report_name}.json"
+
+
+@lru_cache(maxsize=64)
+def _android_code_dir(resources_dir: Path, v: str) -> tuple[Path, ...]:
+    base_dir = (
+        resources_dir / "android_code" / f"platform_frameworks_base-android-{v}_r1"
+    )
+    return (
+        base_dir / "core" / "java",
+        base_dir / "location" / "java",
+    )
+
+
+@lru_cache(maxsize=1)
+def _android_support_code_dir(resources_dir: Path) -> Path:
+    return resources_dir / "android_support_code" / "src"
+
+
+@lru_cache(maxsize=10000)
+def _application_manifest_path(resources_dir: Path, apk_name: str) -> Path:
+    return (
+        resources_dir
+        / "application_code"
+        / apk_name
+        / "resources"
+        / "AndroidManifest.xml"
+    )
+
+
+@lru_cache(maxsize=10000)
+def _application_strings_path(resources_dir: Path, apk_name: str) -> Path:
+    return (
+        resources_dir
+        / "application_code"
+        / apk_name
+        / "resources"
+        / "res"
+        / "values"
+        / "strings.xml"
+    )
+
+
+@lru_cache(maxsize=10000)
+def _application_code_dir(resources_dir: Path, apk_name: str) -> Path:
+    return resources_dir / "application_code" / apk_name / "sources"
+
+
+# String variants of the source code directories, for the code lookup paths that
+# only join a relative file path onto them and open the result.
+@lru_cache(maxsize=64)
+def _android_code_dir_str(resources_dir: Path, v: str) -> tuple[str, ...]:
+    return tuple(str(path) for path in _android_code_dir(resources_dir, v))
+
+
+@lru_cache(maxsize=1)
+def _android_support_code_dir_str(resources_dir: Path) -> str:
+    return str(_android_support_code_dir(resources_dir))
+
+
+@lru_cache(maxsize=10000)
+def _application_code_dir_str(resources_dir: Path, apk_name: str) -> str:
+    return str(_application_code_dir(resources_dir, apk_name))
+
+
+@lru_cache(maxsize=64)
+def _android_cg_path(resources_dir: Path, v: str) -> Path:
+    return resources_dir / "android_cg" / f"android{v}" / f"android{v}_cg.txt"
+
+
+@lru_cache(maxsize=10000)
+def _apk_cg_path(resources_dir: Path, apk_name: str) -> Path:
+    return resources_dir / "apk_cg" / apk_name / f"{apk_name}_cg.txt"
+
+
 config = Config()
 
-set_default_params(cache_dir=config.cache_dir, separate_files=True)
+# Name of the report task that is logging, inherited by its subtasks and threads
+task_name_var: ContextVar[str] = ContextVar("task_name", default="MainThread")
 
 
 # Custom filter to add task name to log records
 class TaskNameFilter(logging.Filter):
     def filter(self, record):
-        try:
-            task = asyncio.current_task()
-        except RuntimeError:
-            record.taskName = "MainThread"
-        else:
-            if task:
-                record.taskName = task.get_name()
-            else:
-                record.taskName = "MainTask"
-
+        record.taskName = task_name_var.get()
         return True
 
 
-def setup_logging(log_file_dir: Path):
-    if not log_file_dir.exists():
-        log_file_dir.mkdir(parents=True, exist_ok=True)
-    log_file_path = log_file_dir / "app.log"
+_log_listener: logging.handlers.QueueListener | None = None
+_log_file_path: Path | None = None
+_log_pid: int | None = None
+
+
+def _stop_log_listener():
+    # QueueListener.stop can not be called twice, and this may run from both an
+    # explicit stop and the atexit hook
+    global _log_listener, _log_file_path
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+        _log_file_path = None
 
+
+atexit.register(_stop_log_listener)
+
+
+def setup_logging(log_file_dir: Path):
     try:
         task = asyncio.current_task()
         if task:
             task.set_name("MainTask")
+            task_name_var.set("MainTask")
     except RuntimeError:
         pass
 
+    global _log_listener, _log_file_path, _log_pid
+    log_file_path = log_file_dir / "app.log"
+    # Logging is already set up for this file, keep the running handlers. A
+    # forked process inherits the handlers but not the listener thread, so it
+    # has to set logging up again.
+    if log_file_path == _log_file_path and _log_pid == os.getpid():
+        return
+
+    log_file_dir.mkdir(parents=True, exist_ok=True)
+    handlers = ["console", "file"] if config.verbose else ["file"]
+
+    _stop_log_listener()
+    log_queue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, logging.FileHandler(log_file_path, mode="a", encoding="utf-8")
+    )
+
+    # HTTP client records are only interesting while debugging; otherwise keep
+    # them at WARNING so that each API call does not emit records through the
+    # handlers. openai logs full request bodies at DEBUG.
+    http_level = "INFO" if config.debug else "WARNING"
+    loggers = {
+        "crash_locator": {
+            "handlers": handlers,
+            "level": "DEBUG",
+            "propagate": False,
+        },
+        "httpx": {
+            "handlers": handlers,
+            "level": http_level,
+            "propagate": False,
+        },
+        "httpcore": {
+            "handlers": handlers,
+            "level": http_level,
+            "propagate": False,
+        },
+        "openai": {
+            "handlers": handlers,
+            "level": "DEBUG" if config.debug else "INFO",
+            "propagate": False,
+        },
+    }
+
     logging.config.dictConfig(
         {
             # Always 1. Schema versioning may be added in a future release of logging
@@ -249,50 +425,43 @@ def setup_logging(log_file_dir: Path):
                     # Add the filter to the handler
                     "filters": ["task_name_filter"],
                 },
+                # Records are formatted here and written to the log file by the
+                # queue listener thread, so file I/O stays off the event loop.
                 "file": {
-                    "class": "logging.FileHandler",
+                    "()": logging.handlers.QueueHandler,
                     "formatter": "standard",
                     "level": "DEBUG",
-                    "filename": log_file_path,
-                    "mode": "a",
-                    "encoding": "utf-8",
+                    "queue": log_queue,
                     # Add the filter to the handler
                     "filters": ["task_name_filter"],
                 },
             },
-            "loggers": {
-                "crash_locator": {
-                    "handlers": ["console", "file"],
-                    "level": "DEBUG",
-                    "propagate": False,
-                },
-                "httpx": {
-                    "handlers": ["console", "file"],
-                    "level": "INFO",
-                    "propagate": False,
-                },
-                "httpcore": {
-                    "handlers": ["console", "file"],
-                    "level": "INFO",
-                    "propagate": False,
-                },
-                "openai": {
-                    "handlers": ["console", "file"],
-                    "level": "DEBUG",
-                    "propagate": False,
-                },
-            },
+            "loggers": loggers,
             # Just a standalone kwarg for the root logger
-            "root": {"level": "DEBUG", "handlers": ["console", "file"]},
+            "root": {"level": "DEBUG", "handlers": handlers},
             "disable_existing_loggers": True,
         }
     )
+    _log_listener.start()
+    _log_file_path = log_file_path
+    _log_pid = os.getpid()
+
+
+def setup_worker_logging(log_file_dir: Path):
+    """
+    Set up logging in a worker process of a process pool.
+
+    Forked pool workers leave through `os._exit` and skip atexit callbacks, so
+    the log queue is also flushed by a multiprocessing finalizer. Spawned
+    workers run both, which is fine since stopping the listener is idempotent.
+    """
+    setup_logging(log_file_dir)
+    multiprocessing.util.Finalize(None, _stop_log_listener, exitpriority=0)
 
 
 def init_statistic() -> RunStatistic:
     if config.result_statistic_path.exists():
-        with open(config.result_statistic_path, "r") as f:
-            run_statistic = RunStatistic(**json.load(f))
+        run_statistic = RunStatistic.load(config.result_statistic_path)
     else:
         run_statistic = RunStatistic(
             config=RunStatistic.RunConfig(
@@ -312,7 +481,23 @@ def init_statistic() -> RunStatistic:
     return run_statistic
 
 
-run_statistic: RunStatistic = init_statistic()
+_run_statistic: RunStatistic | None = None
+
+
+def get_run_statistic() -> RunStatistic:
+    """Load the run statistic on first use instead of at import time."""
+    global _run_statistic
+    if _run_statistic is None:
+        _run_statistic = init_statistic()
+    return _run_statistic
+
+
+def __getattr__(name: str):
+    # Keep `from crash_locator.config import run_statistic` working
+    if name == "run_statistic":
+        return get_run_statistic()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
     print(config.model_dump_json(indent=4))
@@ -1,133 +1,102 @@
 from crash_locator.my_types import MethodSignature
 
 
-class PreCheckException(Exception):
-    def __init__(self, message="Pre-check failed"):
-        self.message = message
-        super().__init__(self.message)
+class _DefaultMessageException(Exception):
+    default_message = "Exception"
+
+    def __init__(self, message: str | None = None):
+        super().__init__(self.default_message if message is None else message)
+
+    @property
+    def message(self) -> str:
+        return self.args[0] if self.args else ""
+
+
+class PreCheckException(_DefaultMessageException):
+    default_message = "Pre-check failed"
 
 
 class EmptyExceptionInfoException(PreCheckException):
-    def __init__(self, message="Exception information is empty"):
-        self.message = message
-        super().__init__(self.message)
+    default_message = "Exception information is empty"
 
 
 class InvalidSignatureException(PreCheckException):
-    def __init__(self, message="Invalid signature"):
-        self.message = message
-        super().__init__(self.message)
+    default_message = "Invalid signature"
 
 
 class InvalidFrameworkStackException(PreCheckException):
-    def __init__(self, message="Invalid framework stack"):
-        self.message = message
-        super().__init__(self.message)
+    default_message = "Invalid framework stack"
 
 
 class NoBuggyMethodCandidatesException(PreCheckException):
-    def __init__(self, message="No buggy method candidates in the report"):
-        self.message = message
-        super().__init__(self.message)
+    default_message = "No buggy method candidates in the report"
 
 
 class CandidateCodeNotFoundException(PreCheckException):
     def __init__(self, candidate_name: str, reason: str):
-        self.message = f"Candidate code not found for {candidate_name}, {reason}"
-        super().__init__(self.message)
+        super().__init__(f"Candidate code not found for {candidate_name}, {reason}")
 
 
 class FrameworkCodeNotFoundException(PreCheckException):
     def __init__(self, method_signature: MethodSignature, reason: str):
-        self.message = f"Framework code not found for {method_signature}, {reason}"
-        super().__init__(self.message)
+        super().__init__(f"Framework code not found for {method_signature}, {reason}")
 
 
 class NoTerminalAPIException(PreCheckException):
-    def __init__(self, message="No terminal API found in the report"):
-        self.message = message
-        super().__init__(self.message)
+    default_message = "No terminal API found in the report"
 
 
-class CodeRetrievalException(Exception):
-    def __init__(self, message="Code retrieval exception"):
-        self.message = message
-        super().__init__(self.message)
+class CodeRetrievalException(_DefaultMessageException):
+    default_message = "Code retrieval exception"
 
 
 class CodeFileNotFoundException(CodeRetrievalException):
-    def __init__(self, message="Code file not found"):
-        self.message = message
-        super().__init__(self.message)
+    default_message = "Code file not found"
 
 
 class MultipleMethodsCodeError(CodeRetrievalException):
-    def __init__(self, message="Multiple methods found with the same name"):
-        self.message = message
-        super().__init__(self.message)
+    default_message = "Multiple methods found with the same name"
 
 
 class NoMethodFoundCodeError(CodeRetrievalException):
-    def __init__(self, message="No method found in the report"):
-        self.message = message
-        super().__init__(self.message)
+    default_message = "No method found in the report"
 
 
 class ClassNotFoundException(CodeRetrievalException):
-    def __init__(self, message="Class not found"):
-        self.message = message
-        super().__init__(self.message)
+    default_message = "Class not found"
 
 
 class FieldNotFoundException(CodeRetrievalException):
-    def __init__(self, message="Field not found"):
-        self.message = message
-        super().__init__(self.message)
+    default_message = "Field not found"
 
 
 class MultipleClassesFoundCodeError(CodeRetrievalException):
-    def __init__(self, message="Multiple classes found with the same name"):
-        self.message = message
-        super().__init__(self.message)
+    default_message = "Multiple classes found with the same name"
 
 
-class UnknownException(Exception):
-    def __init__(self, message="Unknown exception"):
-        self.message = message
-        super().__init__(self.message)
+class UnknownException(_DefaultMessageException):
+    default_message = "Unknown exception"
 
 
-class TreeSitterException(Exception):
-    def __init__(self, message="Tree Sitter exception"):
-        self.message = message
-        super().__init__(self.message)
+class TreeSitterException(_DefaultMessageException):
+    default_message = "Tree Sitter exception"
 
 
 class MultipleChildrenFoundException(TreeSitterException):
-    def __init__(self, message="Multiple children found"):
-        self.message = message
-        super().__init__(self.message)
+    default_message = "Multiple children found"
 
 
-class LLMException(Exception):
-    def __init__(self, message="LLM exception"):
-        self.message = message
-        super().__init__(self.message)
+class LLMException(_DefaultMessageException):
+    default_message = "LLM exception"
 
 
 class UnExpectedResponseException(LLMException):
-    def __init__(self, message="Unexpected response from LLM"):
-        self.message = message
-        super().__init__(self.message)
+    default_message = "Unexpected response from LLM"
 
 
-class LoggerNotFoundException(Exception):
-    def __init__(self, message="Logger not found"):
-        self.message = message
-        super().__init__(self.message)
+class LoggerNotFoundException(_DefaultMessageException):
+    default_message = "Logger not found"
 
 
-class TaskCancelledException(Exception):
-    def __init__(self, message="Task cancelled"):
-        self.message = message
-        super().__init__(self.message)
+class TaskCancelledException(_DefaultMessageException):
+    default_message = "Task cancelled"
@@ -1,13 +1,30 @@
+import atexit
+import hashlib
+import logging
+import pickle
+import sys
 import threading
-from typing import Literal
+from typing import ClassVar, Literal
 from typing import Annotated
-from pydantic import BaseModel, Field, PrivateAttr
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+)
+import orjson
 import re
 from pathlib import Path
 from enum import Enum, StrEnum
 from typing import Self
 from crash_locator.types.llm import TokenUsage, ReasoningEffort
+from crash_locator.utils.fs import atomic_write_bytes
 from textwrap import dedent
+from functools import cached_property, lru_cache
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
 
 
 class PreCheckRawStatistic(BaseModel):
@@ -132,8 +149,23 @@ class RunStatistic(BaseModel):
     corrected_buggy_method: int = 0
     corrected_buggy_method_detail: dict[str, int] = Field(default_factory=dict)
 
+    # Number of updates between two writes of the statistic file
+    SAVE_INTERVAL: ClassVar[int] = 20
+    # Seconds between background writes of pending updates
+    FLUSH_INTERVAL: ClassVar[float] = 5.0
+
+    # `_lock` guards the statistic itself, `_save_lock` orders the file writes
     _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _save_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
     _path: Path = PrivateAttr(default=None)
+    _unsaved_updates: int = PrivateAttr(default=0)
+    # Whether there are updates that the pickled checkpoint does not contain
+    _checkpoint_stale: bool = PrivateAttr(default=False)
+    _flusher: threading.Thread | None = PrivateAttr(default=None)
+    # Wakes the flusher once SAVE_INTERVAL updates are pending
+    _save_requested: threading.Event = PrivateAttr(default_factory=threading.Event)
+    # JSON-ready dumps of finished reports, reused across saves
+    _dumped_reports: dict[str, dict] = PrivateAttr(default_factory=dict)
 
     def __init__(self, **data):
         path = data.pop("_path", None)
@@ -141,6 +173,82 @@ class RunStatistic(BaseModel):
         if path is not None:
             self._path = path
 
+    def __getstate__(self):
+        state = super().__getstate__()
+        # The lock can not be pickled, and the path is set again after loading
+        state["__pydantic_private__"] = None
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._path = None
+        self._unsaved_updates = 0
+        self._checkpoint_stale = False
+        self._flusher = None
+        self._save_requested = threading.Event()
+        self._dumped_reports = {}
+
+    @staticmethod
+    def checkpoint_path(path: Path) -> Path:
+        """
+        Path of the pickled checkpoint stored next to the statistic file
+        """
+        return path.with_suffix(".pkl")
+
+    @classmethod
+    def load(cls, path: Path) -> Self:
+        """
+        Load the statistic from `path`, preferring the pickled checkpoint when it
+        is at least as new as the JSON file, since it skips validation.
+        """
+        checkpoint_path = cls.checkpoint_path(path)
+        if (
+            checkpoint_path.exists()
+            and checkpoint_path.stat().st_mtime >= path.stat().st_mtime
+        ):
+            statistic = cls._load_checkpoint(checkpoint_path)
+            if statistic is not None:
+                return statistic
+        return cls.model_validate_json(path.read_bytes())
+
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _checkpoint_schema(cls) -> str:
+        """
+        Fingerprint of the model layout, stored with each checkpoint so that one
+        pickled by a different version of the model is never loaded.
+        """
+        return hashlib.sha256(
+            orjson.dumps(cls.model_json_schema(), option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()
+
+    @classmethod
+    def _load_checkpoint(cls, checkpoint_path: Path) -> Self | None:
+        """
+        Unpickle a checkpoint, or return None when it was written for another
+        layout of the model or can not be read, so the JSON file is used.
+        """
+        try:
+            with open(checkpoint_path, "rb") as f:
+                schema, payload = pickle.load(f)
+            if schema != cls._checkpoint_schema():
+                return None
+            statistic = pickle.loads(payload)
+        except (
+            OSError,
+            EOFError,
+            AttributeError,
+            ImportError,
+            IndexError,
+            TypeError,
+            ValueError,
+            pickle.UnpicklingError,
+        ):
+            return None
+        return statistic if isinstance(statistic, cls) else None
+
     def _sort(self):
         self.finished_reports_detail = dict(
             sorted(
@@ -149,17 +257,101 @@ class RunStatistic(BaseModel):
             )
         )
 
+    def _dump_json_ready(self) -> dict:
+        """
+        Same result as `model_dump(mode="json")`, but finished reports are only
+        dumped once and then reused, since they never change after being added.
+        """
+        data = self.model_dump(mode="json", exclude={"finished_reports_detail"})
+        dumped_reports = {}
+        for report_name, finished_report in self.finished_reports_detail.items():
+            dumped = self._dumped_reports.get(report_name)
+            if dumped is None:
+                dumped = self._dumped_reports[report_name] = finished_report.model_dump(
+                    mode="json"
+                )
+            dumped_reports[report_name] = dumped
+        data["finished_reports_detail"] = dumped_reports
+        # Keep the field order of the full dump
+        return {name: data[name] for name in type(self).model_fields}
+
     def _save_statistic(self):
-        if self._path is None:
-            raise ValueError("Path is not set")
-        self._sort()
-        with open(self._path, "w") as f:
-            f.write(self.model_dump_json(indent=4))
+        # The statistic is only locked while the snapshot is serialized, so
+        # updates from other threads are not blocked by the file writes.
+        with self._save_lock:
+            with self._lock:
+                if self._path is None:
+                    raise ValueError("Path is not set")
+                path = self._path
+                self._sort()
+                statistic_json = orjson.dumps(
+                    self._dump_json_ready(), option=orjson.OPT_INDENT_2
+                )
+                self._unsaved_updates = 0
+            atomic_write_bytes(path, statistic_json)
+
+    def _write_checkpoint(self):
+        # Pickling walks the whole model under the lock, so it is only done when
+        # the statistic is flushed at the end of a run, not on every save.
+        with self._save_lock:
+            with self._lock:
+                if self._path is None:
+                    raise ValueError("Path is not set")
+                path = self._path
+                payload = pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+                self._checkpoint_stale = False
+            atomic_write_bytes(
+                self.checkpoint_path(path),
+                pickle.dumps(
+                    (self._checkpoint_schema(), payload),
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                ),
+            )
+
+    def _mark_updated(self) -> bool:
+        """
+        Count an update, return whether the statistic is due to be saved
+        """
+        self._unsaved_updates += 1
+        self._checkpoint_stale = True
+        return self._unsaved_updates >= self.SAVE_INTERVAL
+
+    def _request_save(self):
+        # Leave the write to the flusher thread when it runs, so the updating
+        # thread does not wait for it; burst requests coalesce into one save.
+        if self._flusher is not None:
+            self._save_requested.set()
+        else:
+            self._save_statistic()
+
+    def _flush_pending(self):
+        if self._unsaved_updates > 0:
+            self._save_statistic()
+
+    def flush(self):
+        """
+        Write pending updates to the statistic file, together with the pickled
+        checkpoint that `load` prefers. Called at the end of a run and at exit.
+        """
+        self._flush_pending()
+        if self._checkpoint_stale:
+            self._write_checkpoint()
+
+    def _flush_periodically(self):
+        while True:
+            self._save_requested.wait(self.FLUSH_INTERVAL)
+            self._save_requested.clear()
+            try:
+                self._flush_pending()
+            except Exception:
+                logger.exception("Failed to save the run statistic")
 
     def add_token_usage(self, token_usage: TokenUsage):
         with self._lock:
             self.token_usage += token_usage
-            self._save_statistic()
+            save_due = self._mark_updated()
+        if save_due:
+            self._request_save()
 
     def add_report(
         self,
@@ -168,6 +360,7 @@ class RunStatistic(BaseModel):
     ):
         with self._lock:
             self.finished_reports_detail[report_name] = finished_report
+            self._dumped_reports.pop(report_name, None)
 
             match finished_report:
                 case ProcessedReportInfo():
@@ -195,7 +388,9 @@ class RunStatistic(BaseModel):
                 case _:
                     raise ValueError(f"Unknown finished report info: {finished_report}")
 
-            self._save_statistic()
+            save_due = self._mark_updated()
+        if save_due:
+            self._request_save()
 
     def remove_report(self, report_name: str):
         """
@@ -207,55 +402,309 @@ class RunStatistic(BaseModel):
                     self.finished_reports_detail[report_name], FailedReportInfo
                 ):
                     del self.finished_reports_detail[report_name]
+                    self._dumped_reports.pop(report_name, None)
                     self.failed_reports -= 1
-                    self._save_statistic()
+                    save_due = self._mark_updated()
                 else:
                     raise ValueError(f"Report {report_name} is not failed")
             else:
                 raise ValueError(f"Report {report_name} not found")
+        if save_due:
+            self._request_save()
 
     def set_path(self, path: Path):
         with self._lock:
+            if self._path is None:
+                atexit.register(self.flush)
             self._path = path
+            # Saves are written by a daemon thread, either once SAVE_INTERVAL
+            # updates are pending or after FLUSH_INTERVAL, so a slow run never
+            # leaves updates unsaved for long.
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_periodically,
+                    name="run-statistic-flusher",
+                    daemon=True,
+                )
+                self._flusher.start()
+
+
+# The inner class group excludes the leading `$`, so the strip below only
+# allocates for unusual names that end in (or repeat) `$`.
+_CLASS_SIG_PATTERN = re.compile(r"^(\S+)\.(\w+)(?:\$(\S+))?$")
+
+
+# Package, class and method names repeat across the stack traces of many
+# reports, so the parsers intern the strings they return. They are cached, so
+# each distinct signature is interned once instead of validating every model.
+def _intern_optional(value: str | None) -> str | None:
+    return None if value is None else sys.intern(value)
 
 
 class ClassSignature(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     package_name: str
     class_name: str
     inner_class: str | None = None
 
     @classmethod
+    @lru_cache(maxsize=131_072)
     def from_str(cls, class_signature: str) -> Self:
         """
         Example Class Signature:
         1. android.view.ViewRoot
         2. android.view.ViewRoot$checkThread
+
+        Parsed signatures are cached and shared, so they must not be mutated.
         """
         from crash_locator.exceptions import InvalidSignatureException
 
         class_signature = class_signature.strip().strip("<>")
-        pattern = r"^(\S+)\.(\w+)(\$\S+)?$"
-        match = re.match(pattern, class_signature)
+        match = _CLASS_SIG_PATTERN.match(class_signature)
         if match:
             package_name, class_name, inner_class = match.groups()
-            return cls(
-                package_name=package_name,
-                class_name=class_name,
-                inner_class=inner_class.strip("$") if inner_class else None,
+            # Regex groups are well-formed strings, skip model validation
+            return cls.model_construct(
+                package_name=sys.intern(package_name),
+                class_name=sys.intern(class_name),
+                inner_class=_intern_optional(
+                    inner_class.strip("$") if inner_class is not None else None
+                ),
             )
         else:
             raise InvalidSignatureException(
                 f"Invalid class signature: {class_signature}"
             )
 
-    def __str__(self) -> str:
+    @cached_property
+    def _str(self) -> str:
         return f"{self.package_name}.{self.class_name}{'.' + self.inner_class if self.inner_class else ''}"
 
-    def into_path(self) -> Path:
+    @cached_property
+    def _path(self) -> Path:
         return Path(self.package_name.replace(".", "/")) / f"{self.class_name}.java"
 
+    def __str__(self) -> str:
+        return self._str
+
+    def into_path(self) -> Path:
+        return self._path
+
+
+# Both signature forms share the `package.Class$Inner` prefix, so a single
+# pattern matches it once and then branches on the full or dotted form.
+_SIG_PATTERN = re.compile(
+    r"^(?P<package>\S+)\.(?P<cls>\w+)(?:\$(?P<inner>\S+))?"
+    r"(?:: (?P<return_type>\S+) (?P<method><(?:cl)?init>|[\w$]+)"
+    r"(?:\((?P<params>[^()]*?)\))?"
+    r"|\.(?P<short_method>\S+))$"
+)
+
+
+@dataclass(slots=True, frozen=True)
+class ParsedSignature:
+    """
+    Lightweight, immutable result of parsing a method signature.
+
+    Use it where the fields are only read; call `to_model` when a validated
+    `MethodSignature` is needed.
+    """
+
+    package_name: str
+    class_name: str
+    inner_class: str | None
+    method_name: str
+    return_type: str | None
+    parameters: tuple[str, ...] | None
+
+    def to_model(self) -> "MethodSignature":
+        # The parts come from the parser, already well-formed and interned, so
+        # the model is built without validation.
+        return MethodSignature.model_construct(
+            package_name=self.package_name,
+            class_name=self.class_name,
+            inner_class=self.inner_class,
+            method_name=self.method_name,
+            return_type=self.return_type,
+            # Each model owns its parameter list, the parsed value is shared
+            parameters=list(self.parameters) if self.parameters is not None else None,
+        )
+
+
+def _split_class_part(
+    qualified_class: str,
+) -> tuple[str, str, str | None] | None:
+    """
+    Split a whitespace-free `package.Class$Inner` into its parts, or return
+    None when the regex would have split it differently.
+    """
+    package_name, _, class_part = qualified_class.rpartition(".")
+    class_name, dollar, inner_class = class_part.partition("$")
+    if (
+        not package_name
+        or not class_name.replace("_", "a").isalnum()
+        or (dollar and not inner_class)
+    ):
+        return None
+    return package_name, class_name, inner_class.strip("$") if inner_class else None
+
+
+def _interned_signature(
+    package_name: str,
+    class_name: str,
+    inner_class: str | None,
+    method_name: str,
+    return_type: str | None,
+    parameters: tuple[str, ...] | None,
+) -> ParsedSignature:
+    # Parameters are interned by `_split_parameters`
+    return ParsedSignature(
+        package_name=sys.intern(package_name),
+        class_name=sys.intern(class_name),
+        inner_class=_intern_optional(inner_class),
+        method_name=sys.intern(method_name),
+        return_type=_intern_optional(return_type),
+        parameters=parameters,
+    )
+
+
+def _split_parameters(params: str) -> tuple[str, ...]:
+    # strip and drop empty parameters in a single pass; parameter types such as
+    # `int` or `android.content.Context` repeat across signatures, so intern them
+    return tuple(
+        sys.intern(stripped)
+        for param in params.split(",")
+        if (stripped := param.strip())
+    )
+
+
+def _parse_short_method_signature(method_signature: str) -> ParsedSignature | None:
+    """
+    Split a whitespace-free `package.Class$Inner.method` signature with string
+    partitions. Returns None when the parts are not in the shape the regex
+    would have produced, so the caller falls back to it.
+    """
+    rest, _, method_name = method_signature.rpartition(".")
+    class_parts = _split_class_part(rest)
+    if not method_name or class_parts is None:
+        return None
+
+    package_name, class_name, inner_class = class_parts
+    return _interned_signature(
+        package_name=package_name,
+        class_name=class_name,
+        inner_class=inner_class,
+        method_name=method_name,
+        return_type=None,
+        parameters=None,
+    )
+
+
+def _parse_full_method_signature(method_signature: str) -> ParsedSignature | None:
+    """
+    Tokenize a `package.Class$Inner: return_type method(params)` signature with
+    string searches. Like the short form, returns None for anything outside
+    the plain shape so the caller falls back to the regex.
+    """
+    class_part, _, rest = method_signature.partition(": ")
+    return_type, _, method_part = rest.partition(" ")
+    if (
+        " " in class_part
+        or not class_part.isprintable()
+        or not return_type
+        or not return_type.isprintable()
+    ):
+        return None
+
+    if method_part.endswith(")"):
+        paren = method_part.find("(")
+        method_name = method_part[:paren]
+        params = method_part[paren + 1 : -1]
+        if paren == -1 or "(" in params or ")" in params:
+            return None
+        parameters = _split_parameters(params)
+    elif "(" in method_part or ")" in method_part:
+        return None
+    else:
+        method_name = method_part
+        parameters = None
+
+    if method_name not in ("<init>", "<clinit>") and not (
+        method_name.replace("$", "a").replace("_", "a").isalnum()
+    ):
+        return None
+
+    class_parts = _split_class_part(class_part)
+    if class_parts is None:
+        return None
+
+    package_name, class_name, inner_class = class_parts
+    return _interned_signature(
+        package_name=package_name,
+        class_name=class_name,
+        inner_class=inner_class,
+        method_name=method_name,
+        return_type=return_type,
+        parameters=parameters,
+    )
+
+
+@lru_cache(maxsize=100_000)
+def parse_method_signature(method_signature: str) -> ParsedSignature:
+    """
+    Parse a method signature without building a pydantic model. The same
+    framework signatures recur across stack traces of many reports, so
+    results are cached.
+    """
+    from crash_locator.exceptions import InvalidSignatureException
+
+    method_signature = method_signature.strip().strip("<>")
+    if (
+        ":" not in method_signature
+        and "(" not in method_signature
+        and " " not in method_signature
+        and method_signature.isprintable()
+    ):
+        parsed = _parse_short_method_signature(method_signature)
+        if parsed is not None:
+            return parsed
+    elif ": " in method_signature:
+        parsed = _parse_full_method_signature(method_signature)
+        if parsed is not None:
+            return parsed
+
+    match = _SIG_PATTERN.match(method_signature)
+    if match is None:
+        raise InvalidSignatureException(f"Invalid signature: {method_signature}")
+
+    package_name, class_name, inner_class, return_type, method_name, params = (
+        match.group("package", "cls", "inner", "return_type", "method", "params")
+    )
+    if inner_class:
+        inner_class = inner_class.strip("$")
+    if return_type is None:
+        method_name = match["short_method"]
+        parameters = None
+    elif params is not None:
+        parameters = _split_parameters(params)
+    else:
+        parameters = None
+
+    return _interned_signature(
+        package_name=package_name,
+        class_name=class_name,
+        inner_class=inner_class,
+        method_name=method_name,
+        return_type=return_type,
+        parameters=parameters,
+    )
+
 
 class MethodSignature(BaseModel):
+    # Instances are cached and shared by `from_str`, so they are immutable
+    model_config = ConfigDict(frozen=True)
+
     package_name: str
     class_name: str
     inner_class: str | None = None
@@ -264,6 +713,7 @@ class MethodSignature(BaseModel):
     parameters: list[str] | None = None
 
     @classmethod
+    @lru_cache(maxsize=131_072)
     def from_str(cls, method_signature: str) -> Self:
         """
         Example Method Signature:
@@ -273,63 +723,40 @@ class MethodSignature(BaseModel):
 
         Counter Example:
         1. <android.view.View: void invalidate(android.graphics.Rect)>; <android.view.View: void invalidate(int,int,int,int)>; <android.view.View: void invalidate()>
+
+        Parsed signatures are cached and shared, so they must not be mutated.
         """
-        from crash_locator.exceptions import InvalidSignatureException
+        return parse_method_signature(method_signature).to_model()
 
-        method_signature = method_signature.strip().strip("<>")
-        pattern1 = (
-            r"^(\S+)\.(\w+)(\$\S+)?: (\S+) ([\w$]+|<init>|<clinit>)(\([^()]*?\))?$"
-        )
-        pattern2 = r"^(\S+)\.(\w+)(\$\S+)?\.(\S+)$"
-        match1 = re.match(pattern1, method_signature)
-        match2 = re.match(pattern2, method_signature)
-        if match1:
-            (
-                package_name,
-                class_name,
-                inner_class,
-                return_type,
-                method_name,
-                parameter_list,
-            ) = match1.groups()
-            if inner_class:
-                inner_class = inner_class.strip("$")
-            if parameter_list:
-                parameters = [
-                    param.strip() for param in parameter_list.strip("()").split(",")
-                ]
-                # remove empty string
-                parameters = list(filter(None, parameters))
-            else:
-                parameters = None
-        elif match2:
-            package_name, class_name, inner_class, method_name = match2.groups()
-            if inner_class:
-                inner_class = inner_class.strip("$")
-
-            return_type = None
-            parameters = None
+    # Signatures are not mutated after construction, so the derived path,
+    # string and class name are computed once per instance.
+    @cached_property
+    def _path(self) -> Path:
+        return Path(self.package_name.replace(".", "/")) / f"{self.class_name}.java"
+
+    @cached_property
+    def _str(self) -> str:
+        if self.parameters is not None and self.return_type is not None:
+            params = ", ".join(self.parameters) if self.parameters else ""
+            return f"{self.package_name}.{self.class_name}{'.' + self.inner_class if self.inner_class else ''}: {self.return_type} {self.method_name}({params})"
+        elif self.parameters is None and self.return_type is None:
+            return f"{self.package_name}.{self.class_name}{'.' + self.inner_class if self.inner_class else ''}.{self.method_name}"
         else:
-            raise InvalidSignatureException(f"Invalid signature: {method_signature}")
-
-        return cls(
-            package_name=package_name,
-            class_name=class_name,
-            inner_class=inner_class,
-            method_name=method_name,
-            return_type=return_type,
-            parameters=parameters,
-        )
+            raise ValueError(f"Invalid method signature: {self!r}")
 
     def into_path(self) -> Path:
-        return Path(self.package_name.replace(".", "/")) / f"{self.class_name}.java"
+        return self._path
 
-    def full_class_name(self) -> str:
+    @cached_property
+    def _full_class_name(self) -> str:
         class_name = f"{self.package_name}.{self.class_name}"
         if self.inner_class:
             class_name = f"{class_name}.{self.inner_class.replace('$', '.')}"
         return class_name
 
+    def full_class_name(self) -> str:
+        return self._full_class_name
+
     def into_basic_name(self) -> str:
         return f"{self.full_class_name()}.{self.method_name}"
 
@@ -340,41 +767,45 @@ class MethodSignature(BaseModel):
         return class_list
 
     def __str__(self) -> str:
-        if self.parameters is not None and self.return_type is not None:
-            params = ", ".join(self.parameters) if self.parameters else ""
-            return f"{self.package_name}.{self.class_name}{'.' + self.inner_class if self.inner_class else ''}: {self.return_type} {self.method_name}({params})"
-        elif self.parameters is None and self.return_type is None:
-            return f"{self.package_name}.{self.class_name}{'.' + self.inner_class if self.inner_class else ''}.{self.method_name}"
-        else:
-            raise ValueError(f"Invalid method signature: {self}")
-
-    def __eq__(self, other: "MethodSignature") -> bool:
-        if self.package_name != other.package_name:
-            return False
-        if self.class_name != other.class_name:
-            return False
-        if self.inner_class != other.inner_class:
-            return False
-        if self.method_name != other.method_name:
-            return False
-        if (
-            self.return_type is not None
-            and other.return_type is not None
-            and self.return_type != other.return_type
-        ):
-            return False
-        if (
-            self.parameters is not None
-            and other.parameters is not None
-            and self.parameters != other.parameters
-        ):
-            return False
-        return True
+        return self._str
+
+    @cached_property
+    def _identity(self) -> tuple[str, str, str | None, str]:
+        return (self.package_name, self.class_name, self.inner_class, self.method_name)
+
+    def __hash__(self) -> int:
+        # `__eq__` treats a missing return type or parameter list as a
+        # wildcard, so only the always-present parts take part in the hash.
+        return hash(self._identity)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, MethodSignature):
+            return NotImplemented
+        return (
+            self._identity == other._identity
+            and (
+                self.return_type is None
+                or other.return_type is None
+                or self.return_type == other.return_type
+            )
+            and (
+                self.parameters is None
+                or other.parameters is None
+                or self.parameters == other.parameters
+            )
+        )
 
 
 class CandidateReason(BaseModel):
+    # Reasons are never modified after loading, and freezing them keeps the
+    # cached `reason_explanation` consistent with the fields.
+    model_config = ConfigDict(frozen=True)
+
     reason_type: str
 
+    @cached_property
     def reason_explanation(self) -> str:
         pass
 
@@ -400,12 +831,18 @@ class KeyVarTerminalReason(CandidateReason):
     call_chain_to_entry: list[str]
     terminal_api: str
 
-    def reason_explanation(self) -> str:
-        return dedent(f"""\
-            Our static analysis tool detect that some buggy parameter value is passed to `{self.framework_entry_api}` by call chain {self.call_chain_to_entry}.
+    EXPLANATION_TEMPLATE: ClassVar[str] = dedent("""\
+        Our static analysis tool detect that some buggy parameter value is passed to `{framework_entry_api}` by call chain {call_chain_to_entry}.
 
-            You can verify whether this method can indeed pass these incorrect parameters to the framework layer. If so, this method is likely related to the crash.
-            """)
+        You can verify whether this method can indeed pass these incorrect parameters to the framework layer. If so, this method is likely related to the crash.
+        """)
+
+    @cached_property
+    def reason_explanation(self) -> str:
+        return self.EXPLANATION_TEMPLATE.format(
+            framework_entry_api=self.framework_entry_api,
+            call_chain_to_entry=self.call_chain_to_entry,
+        )
 
 
 class KeyVarNonTerminalReason(CandidateReason):
@@ -416,12 +853,19 @@ class KeyVarNonTerminalReason(CandidateReason):
     call_chain_to_terminal: list[str]
     terminal_api: str
 
-    def reason_explanation(self) -> str:
-        return dedent(f"""\
-            Our static analysis tool detect that the method invoke `{self.terminal_api}` by call chain {self.call_chain_to_terminal}.
+    EXPLANATION_TEMPLATE: ClassVar[str] = dedent("""\
+        Our static analysis tool detect that the method invoke `{terminal_api}` by call chain {call_chain_to_terminal}.
 
-            `{self.terminal_api}` method pass buggy parameter to `{self.framework_entry_api}`
-            """)
+        `{terminal_api}` method pass buggy parameter to `{framework_entry_api}`
+        """)
+
+    @cached_property
+    def reason_explanation(self) -> str:
+        return self.EXPLANATION_TEMPLATE.format(
+            terminal_api=self.terminal_api,
+            call_chain_to_terminal=self.call_chain_to_terminal,
+            framework_entry_api=self.framework_entry_api,
+        )
 
 
 class KeyApiInvokedReason(CandidateReason):
@@ -431,12 +875,17 @@ class KeyApiInvokedReason(CandidateReason):
     key_api: str
     key_field: list[str]
 
-    def reason_explanation(self) -> str:
-        return dedent(f"""\
-            We detect that the method `{self.key_api}` which is invoked before the crash can affect the `{self.key_field}` field in Android Framework so that cause constraint violation.
+    EXPLANATION_TEMPLATE: ClassVar[str] = dedent("""\
+        We detect that the method `{key_api}` which is invoked before the crash can affect the `{key_field}` field in Android Framework so that cause constraint violation.
+
+        You can verify whether this method calls the corresponding API and affects the crash-related fields, thereby causing a crash to occur. If so, this method is likely related to the crash.
+        """)
 
-            You can verify whether this method calls the corresponding API and affects the crash-related fields, thereby causing a crash to occur. If so, this method is likely related to the crash.
-            """)
+    @cached_property
+    def reason_explanation(self) -> str:
+        return self.EXPLANATION_TEMPLATE.format(
+            key_api=self.key_api, key_field=self.key_field
+        )
 
 
 class KeyApiExecutedReason(CandidateReason):
@@ -444,12 +893,15 @@ class KeyApiExecutedReason(CandidateReason):
         ReasonTypeLiteral.KEY_API_EXECUTED
     )
 
-    def reason_explanation(self) -> str:
-        return dedent("""\
-            This method was detected because it was executed during the process of the application crashing.
+    EXPLANATION_TEMPLATE: ClassVar[str] = dedent("""\
+        This method was detected because it was executed during the process of the application crashing.
+
+        You can check if there are other forms of this method that may affect the crash, and if not, this method may not be very related to the crash.
+        """)
 
-            You can check if there are other forms of this method that may affect the crash, and if not, this method may not be very related to the crash.
-            """)
+    @cached_property
+    def reason_explanation(self) -> str:
+        return self.EXPLANATION_TEMPLATE
 
 
 class KeyVarModifiedFieldReason(CandidateReason):
@@ -460,14 +912,17 @@ class KeyVarModifiedFieldReason(CandidateReason):
     api: str
 
     # TODO: add field effect
-    def reason_explanation(self) -> str:
-        return dedent(f"""\
-            Our static analysis detect that the method change the value of field `{self.field}`
+    EXPLANATION_TEMPLATE: ClassVar[str] = dedent("""\
+        Our static analysis detect that the method change the value of field `{field}`
 
-            The field was passed to the method `{self.api}` and meet the crash constraint, resulting in the crash.
+        The field was passed to the method `{api}` and meet the crash constraint, resulting in the crash.
 
-            You can verify whether this method can indeed change the value of the field. If so, this method is likely related to the crash.
-            """)
+        You can verify whether this method can indeed change the value of the field. If so, this method is likely related to the crash.
+        """)
+
+    @cached_property
+    def reason_explanation(self) -> str:
+        return self.EXPLANATION_TEMPLATE.format(field=self.field, api=self.api)
 
 
 class NotOverrideMethodReason(CandidateReason):
@@ -479,14 +934,22 @@ class NotOverrideMethodReason(CandidateReason):
     framework_class: str
     extend_chain: list[str]
 
-    def reason_explanation(self) -> str:
-        return dedent(f"""\
-            Our static analysis tool detect that the class `{self.application_class}` extends the class `{self.framework_class}` by chain {self.extend_chain}.
+    EXPLANATION_TEMPLATE: ClassVar[str] = dedent("""\
+        Our static analysis tool detect that the class `{application_class}` extends the class `{framework_class}` by chain {extend_chain}.
 
-            When `{self.framework_method}` is invoked, an unconditional exception is thrown out.
+        When `{framework_method}` is invoked, an unconditional exception is thrown out.
 
-            But in the application code, the method is not override(Therefore, for this method, no code has been provided)
-            """)
+        But in the application code, the method is not override(Therefore, for this method, no code has been provided)
+        """)
+
+    @cached_property
+    def reason_explanation(self) -> str:
+        return self.EXPLANATION_TEMPLATE.format(
+            application_class=self.application_class,
+            framework_class=self.framework_class,
+            extend_chain=self.extend_chain,
+            framework_method=self.framework_method,
+        )
 
 
 class NotOverrideMethodExecutedReason(CandidateReason):
@@ -494,10 +957,13 @@ class NotOverrideMethodExecutedReason(CandidateReason):
         ReasonTypeLiteral.NOT_OVERRIDE_METHOD_EXECUTED
     )
 
+    EXPLANATION_TEMPLATE: ClassVar[str] = dedent("""\
+        This method was detected because it was executed during the process of the application crashing.
+        """)
+
+    @cached_property
     def reason_explanation(self) -> str:
-        return dedent("""\
-            This method was detected because it was executed during the process of the application crashing.
-            """)
+        return self.EXPLANATION_TEMPLATE
 
 
 class FrameworkRecallReason(CandidateReason):
@@ -505,20 +971,26 @@ class FrameworkRecallReason(CandidateReason):
         ReasonTypeLiteral.FRAMEWORK_RECALL
     )
 
+    EXPLANATION_TEMPLATE: ClassVar[str] = dedent("""\
+        This method is not in the crash stack, it is a recall method invoked by framework method.
+        """)
+
+    @cached_property
     def reason_explanation(self) -> str:
-        return dedent("""\
-            This method is not in the crash stack, it is a recall method invoked by framework method.
-            """)
+        return self.EXPLANATION_TEMPLATE
 
 
 class KeyVar3Reason(CandidateReason):
     reason_type: Literal[ReasonTypeLiteral.KEY_VAR_3] = ReasonTypeLiteral.KEY_VAR_3
 
     # TODO: Need more confirmation
+    EXPLANATION_TEMPLATE: ClassVar[str] = dedent("""\
+        The method is data related to the crash.
+        """)
+
+    @cached_property
     def reason_explanation(self) -> str:
-        return dedent("""\
-            The method is data related to the crash.
-            """)
+        return self.EXPLANATION_TEMPLATE
 
 
 class ManualSupplementReason(CandidateReason):
@@ -546,6 +1018,11 @@ class Candidate(BaseModel):
     ) = Field(discriminator="reason_type")
 
 
+# Lists of candidates are serialized in one pass by a reusable adapter
+# rather than dumping each model and re-encoding the result.
+CANDIDATE_LIST_ADAPTER = TypeAdapter(list[Candidate])
+
+
 class ReportInfo(BaseModel):
     apk_name: str
     android_version: str
@@ -560,6 +1037,14 @@ class ReportInfo(BaseModel):
     candidates: list[Candidate]
     buggy_method: MethodSignature
 
+    @classmethod
+    def from_json_bytes(cls, data: bytes) -> Self:
+        """
+        Validate a saved report info directly from its JSON bytes, without
+        building the intermediate Python dicts first.
+        """
+        return cls.model_validate_json(data)
+
     @property
     def base_candidates(self) -> list[Candidate]:
         """
@@ -568,11 +1053,10 @@ class ReportInfo(BaseModel):
         name_to_candidate = {candidate.name: candidate for candidate in self.candidates}
         candidates = []
         for method in self.stack_trace_short_api:
-            if (
-                method in name_to_candidate
-                and name_to_candidate[method] not in candidates
-            ):
-                candidates.append(name_to_candidate[method])
+            # Popping keeps each candidate once, even if its frame repeats
+            candidate = name_to_candidate.pop(method, None)
+            if candidate is not None:
+                candidates.append(candidate)
         return candidates
 
     @property
@@ -580,10 +1064,11 @@ class ReportInfo(BaseModel):
         """
         The candidates that are not in stack trace
         """
+        stack_methods = set(self.stack_trace_short_api)
         return [
             candidate
             for candidate in self.candidates
-            if candidate.name not in self.stack_trace_short_api
+            if candidate.name not in stack_methods
         ]
 
 
@@ -593,14 +1078,28 @@ class PackageType(Enum):
     APPLICATION = "application"
     ANDROID_SUPPORT = "android_support"
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def from_package_name(package_name: str) -> "PackageType":
+        for prefix, package_type in _PACKAGE_PREFIXES_BY_FIRST_CHAR.get(
+            package_name[:1], ()
+        ):
+            if package_name.startswith(prefix):
+                return package_type
+        return PackageType.APPLICATION
+
     @staticmethod
     def get_package_type(signature: MethodSignature | ClassSignature) -> "PackageType":
-        match signature.package_name:
-            case s if s.startswith("java"):
-                return PackageType.JAVA
-            case s if s.startswith("android.support"):
-                return PackageType.ANDROID_SUPPORT
-            case s if s.startswith("android") or s.startswith("com.android"):
-                return PackageType.ANDROID
-            case _:
-                return PackageType.APPLICATION
+        return PackageType.from_package_name(signature.package_name)
+
+
+# Prefixes bucketed by their first character; within a bucket the longer
+# `android.support` must be checked before `android`.
+_PACKAGE_PREFIXES_BY_FIRST_CHAR: dict[str, tuple[tuple[str, PackageType], ...]] = {
+    "j": (("java", PackageType.JAVA),),
+    "a": (
+        ("android.support", PackageType.ANDROID_SUPPORT),
+        ("android", PackageType.ANDROID),
+    ),
+    "c": (("com.android", PackageType.ANDROID),),
+}
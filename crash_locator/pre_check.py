@@ -1,5 +1,6 @@
 import logging
-from crash_locator.config import config, setup_logging
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from crash_locator.config import config, setup_logging, setup_worker_logging
 from crash_locator.my_types import (
     PackageType,
     ReportInfo,
@@ -26,19 +27,23 @@ from crash_locator.exceptions import (
     CandidateCodeNotFoundException,
     NoTerminalAPIException,
     FrameworkCodeNotFoundException,
+    InvalidSignatureException,
 )
 from tqdm import tqdm
 from tqdm.contrib.logging import logging_redirect_tqdm
 from pathlib import Path
-import json
-import shutil
+import orjson
+from pydantic import BaseModel
+import os
 from crash_locator.my_types import (
     PreCheckStatistic,
     Candidate,
     MethodSignature,
     ReasonTypeLiteral,
+    parse_method_signature,
 )
-from crash_locator.utils.helper import get_method_type
+from crash_locator.utils.helper import get_method_type, link_or_copy
+from crash_locator.utils.fs import atomic_write_bytes
 from crash_locator.utils.java_parser import get_candidate_code, get_framework_code
 
 logger = logging.getLogger()
@@ -83,9 +88,10 @@ def report_completion(report):
     """
     Complete the full signature stack trace of report.
     """
-    apk_name = report["Crash Info in Dataset"]["Apk name"]
+    crash_info = report["Crash Info in Dataset"]
+    apk_name = crash_info["Apk name"]
     android_version = _get_android_version(report)
-    stack_trace = report["Crash Info in Dataset"]["stack trace signature"]
+    stack_trace = crash_info["stack trace signature"]
 
     def _get_ambiguous_method_indexes(
         stack_trace: list[str],
@@ -139,8 +145,9 @@ def report_completion(report):
             if valid_count != len(methods) - 1:
                 continue
             invoke_list = []
+            next_called_methods = set(next_method.values())
             for m in methods:
-                if m not in set(next_method.values()):
+                if m not in next_called_methods:
                     invoke_list.append(m)
                     break
 
@@ -155,13 +162,11 @@ def report_completion(report):
         return None
 
     def complete_stack_trace(stack_trace, apk_name, android_version, call_func):
-        from .utils.parser import parse_signature, InvalidSignatureException
-
         for index, (first_sig, second_sig) in enumerate(
             zip(stack_trace, stack_trace[1:])
         ):
             try:
-                parse_signature(first_sig)
+                parse_method_signature(first_sig)
             except InvalidSignatureException:
                 continue
             if ";" not in second_sig:
@@ -246,7 +251,7 @@ def report_completion(report):
 
         break
 
-    report["Crash Info in Dataset"]["stack trace signature"] = stack_trace
+    crash_info["stack trace signature"] = stack_trace
 
 
 def _find_terminal_api(candidates: list[dict]) -> str | None:
@@ -385,10 +390,8 @@ def _check_exception_info_exist(report: dict) -> None:
 
 def _check_buggy_method_candidates_exist(report: ReportInfo) -> None:
     buggy_method = report.buggy_method
-    for candidate in report.candidates:
-        if candidate.signature == buggy_method:
-            return
-    raise NoBuggyMethodCandidatesException()
+    if not any(candidate.signature == buggy_method for candidate in report.candidates):
+        raise NoBuggyMethodCandidatesException()
 
 
 def _remove_useless_candidates(report: ReportInfo) -> None:
@@ -404,7 +407,8 @@ def _check_candidate_code_exist(report: ReportInfo) -> None:
     If candidate code not exists in **application code directory**, the candidate will be removed.
     if candidate code not found, raise CandidateCodeNotFoundException.
     """
-    for candidate in report.candidates[:]:
+    retained_candidates = []
+    for candidate in report.candidates:
         try:
             get_candidate_code(report.apk_name, candidate)
         except CodeRetrievalException as e:
@@ -413,8 +417,10 @@ def _check_candidate_code_exist(report: ReportInfo) -> None:
             ) from e
         except ValueError:
             if candidate.reasons.reason_type != ReasonTypeLiteral.NOT_OVERRIDE_METHOD:
-                report.candidates.remove(candidate)
                 statistic.removed_candidates += 1
+                continue
+        retained_candidates.append(candidate)
+    report.candidates = retained_candidates
 
 
 def _check_framework_code_exist(report: ReportInfo) -> None:
@@ -429,96 +435,95 @@ def _fix_candidate_signature(report: ReportInfo) -> None:
     """
     Fix the candidate signature due to CrashTracker candidate signature error.
     """
+    # Stack frames are parsed lazily and at most once, however many
+    # candidates need to be matched against them.
+    frame_signatures: dict[int, MethodSignature] = {}
     for candidate in report.candidates:
         if candidate.reasons.reason_type == ReasonTypeLiteral.KEY_VAR_TERMINAL:
-            target_method = None
+            target_signature = None
             duplicate_method = False
-            for method, method_short_api in zip(
-                report.stack_trace, report.stack_trace_short_api
+            for index, (method, method_short_api) in enumerate(
+                zip(report.stack_trace, report.stack_trace_short_api)
             ):
-                sig: MethodSignature = MethodSignature.from_str(method)
+                sig = frame_signatures.get(index)
+                if sig is None:
+                    sig = frame_signatures[index] = MethodSignature.from_str(method)
                 if method_short_api == candidate.name and sig != candidate.signature:
-                    if target_method is None:
-                        target_method = method
+                    if target_signature is None:
+                        target_signature = sig
                     else:
                         duplicate_method = True
                         statistic.fixed_failed_duplicate += 1
                         break
 
-            if target_method is not None and not duplicate_method:
+            if target_signature is not None and not duplicate_method:
                 statistic.fixed_reports += 1
                 if report.apk_name not in statistic.fixed_reports_detail:
                     statistic.fixed_reports_detail[report.apk_name] = []
                 statistic.fixed_reports_detail[report.apk_name].append(
                     {
                         "before": str(candidate.signature),
-                        "after": str(MethodSignature.from_str(target_method)),
+                        "after": str(target_signature),
                     }
                 )
 
-                candidate.signature = MethodSignature.from_str(target_method)
+                candidate.signature = target_signature
 
 
 def _raw_statistic(report: dict):
-    candidate_count = len(
-        report["Fault Localization by CrashTracker"]["Buggy Method Candidates"]
-    )
+    crash_info = report["Crash Info in Dataset"]
+    raw_candidates = report["Fault Localization by CrashTracker"][
+        "Buggy Method Candidates"
+    ]
+    raw_statistic = statistic.raw_statistic
+    has_buggy_method = "Labeled Buggy Method" in crash_info
+    buggy_method = crash_info.get("Labeled Buggy Method")
+
+    candidate_count = len(raw_candidates)
     if candidate_count == 1:
-        statistic.raw_statistic.one_candidate_report_count += 1
-        if "Labeled Buggy Method" in report["Crash Info in Dataset"]:
-            if (
-                report["Crash Info in Dataset"]["Labeled Buggy Method"]
-                == report["Fault Localization by CrashTracker"][
-                    "Buggy Method Candidates"
-                ][0]["Candidate Name"]
-            ):
-                statistic.raw_statistic.one_candidate_report_buggy_method_count += 1
+        raw_statistic.one_candidate_report_count += 1
+        if has_buggy_method and buggy_method == raw_candidates[0]["Candidate Name"]:
+            raw_statistic.one_candidate_report_buggy_method_count += 1
 
-    statistic.raw_statistic.total_candidates += candidate_count
+    raw_statistic.total_candidates += candidate_count
 
-    if "Labeled Buggy Method" in report["Crash Info in Dataset"]:
-        statistic.raw_statistic.total_buggy_method_candidates += 1
+    if has_buggy_method:
+        raw_statistic.total_buggy_method_candidates += 1
 
-        buggy_method = report["Crash Info in Dataset"]["Labeled Buggy Method"]
-        for candidate in report["Fault Localization by CrashTracker"][
-            "Buggy Method Candidates"
-        ]:
+        for candidate in raw_candidates:
             if candidate["Candidate Name"] == buggy_method:
-                statistic.raw_statistic.buggy_method_candidates_exist += 1
+                raw_statistic.buggy_method_candidates_exist += 1
                 break
         else:
-            statistic.raw_statistic.buggy_method_candidates_not_exist += 1
-            statistic.raw_statistic.buggy_method_candidates_not_exist_detail.append(
-                report["Crash Info in Dataset"]["Apk name"]
+            raw_statistic.buggy_method_candidates_not_exist += 1
+            raw_statistic.buggy_method_candidates_not_exist_detail.append(
+                crash_info["Apk name"]
             )
 
 
 def pre_check(crash_report_path: Path) -> ReportInfo:
-    report = json.load(open(crash_report_path, "r"))
+    report = orjson.loads(crash_report_path.read_bytes())
 
     _raw_statistic(report)
     report_completion(report)
 
-    stack_trace = [
-        method.strip("<>")
-        for method in report["Crash Info in Dataset"]["stack trace signature"]
+    crash_info = report["Crash Info in Dataset"]
+    raw_candidates = report["Fault Localization by CrashTracker"][
+        "Buggy Method Candidates"
     ]
-    stack_trace_short_api = report["Crash Info in Dataset"]["stack trace"]
+    stack_trace = [method.strip("<>") for method in crash_info["stack trace signature"]]
+    stack_trace_short_api = crash_info["stack trace"]
     framework_trace, framework_short_trace = _get_and_check_framework_stack(
         stack_trace, stack_trace_short_api
     )
     framework_entry_api = framework_trace[-1]
-    terminal_api = _find_terminal_api(
-        report["Fault Localization by CrashTracker"]["Buggy Method Candidates"]
-    )
+    terminal_api = _find_terminal_api(raw_candidates)
 
     report_info = ReportInfo(
-        apk_name=report["Crash Info in Dataset"]["Apk name"],
+        apk_name=crash_info["Apk name"],
         android_version=_get_android_version(report),
-        target_sdk_version=report["Crash Info in Dataset"]["Manifest targetSdkVersion"],
-        exception_type=report["Crash Info in Dataset"]["Exception Type"]
-        .split(".")[-1]
-        .split("$")[-1],
+        target_sdk_version=crash_info["Manifest targetSdkVersion"],
+        exception_type=crash_info["Exception Type"].split(".")[-1].split("$")[-1],
         stack_trace=stack_trace,
         stack_trace_short_api=stack_trace_short_api,
         framework_trace=[
@@ -543,14 +548,10 @@ def pre_check(crash_report_path: Path) -> ReportInfo:
                     candidate, framework_entry_api, terminal_api
                 ),
             )
-            for candidate in report["Fault Localization by CrashTracker"][
-                "Buggy Method Candidates"
-            ]
+            for candidate in raw_candidates
         ],
-        crash_message=report["Crash Info in Dataset"]["Crash Message"],
-        buggy_method=MethodSignature.from_str(
-            report["Crash Info in Dataset"]["Labeled Buggy Method"]
-        ),
+        crash_message=crash_info["Crash Message"],
+        buggy_method=MethodSignature.from_str(crash_info["Labeled Buggy Method"]),
     )
 
     _fix_candidate_signature(report_info)
@@ -563,52 +564,35 @@ def pre_check(crash_report_path: Path) -> ReportInfo:
 
 
 def _successful_statistic(report: ReportInfo, statistic: PreCheckStatistic):
-    if (
-        len(report.candidates)
-        not in statistic.valid_reports_candidate_nums_distribution
-    ):
-        statistic.valid_reports_candidate_nums_distribution[len(report.candidates)] = 0
-    statistic.valid_reports_candidate_nums_distribution[len(report.candidates)] += 1
+    candidates_num = len(report.candidates)
+    nums_distribution = statistic.valid_reports_candidate_nums_distribution
+    nums_distribution[candidates_num] = nums_distribution.get(candidates_num, 0) + 1
 
+    valid_distribution = statistic.valid_reports_reason_type_distribution
+    processed_distribution = statistic.processed_reports_reason_type_distribution
+    rank_distribution = statistic.valid_reports_buggy_candidate_rank_distribution
     for index, candidate in enumerate(report.candidates):
-        if (
-            candidate.reasons.reason_type
-            not in statistic.valid_reports_reason_type_distribution
-        ):
-            statistic.valid_reports_reason_type_distribution[
-                candidate.reasons.reason_type
-            ] = {"total": 0, "buggy": 0}
-        statistic.valid_reports_reason_type_distribution[candidate.reasons.reason_type][
-            "total"
-        ] += 1
-        if candidate.signature == report.buggy_method:
-            statistic.valid_reports_reason_type_distribution[
-                candidate.reasons.reason_type
-            ]["buggy"] += 1
-
-        if len(report.candidates) > 1:
-            if (
-                candidate.reasons.reason_type
-                not in statistic.processed_reports_reason_type_distribution
-            ):
-                statistic.processed_reports_reason_type_distribution[
-                    candidate.reasons.reason_type
-                ] = {"total": 0, "buggy": 0}
-            statistic.processed_reports_reason_type_distribution[
-                candidate.reasons.reason_type
-            ]["total"] += 1
-            if candidate.signature == report.buggy_method:
-                statistic.processed_reports_reason_type_distribution[
-                    candidate.reasons.reason_type
-                ]["buggy"] += 1
-
-        if candidate.signature == report.buggy_method:
-            rank = index + 1
-            if len(report.candidates) == 1:
-                continue
-            if rank not in statistic.valid_reports_buggy_candidate_rank_distribution:
-                statistic.valid_reports_buggy_candidate_rank_distribution[rank] = 0
-            statistic.valid_reports_buggy_candidate_rank_distribution[rank] += 1
+        reason_type = candidate.reasons.reason_type
+        is_buggy = candidate.signature == report.buggy_method
+
+        reason_count = valid_distribution.setdefault(
+            reason_type, {"total": 0, "buggy": 0}
+        )
+        reason_count["total"] += 1
+        if is_buggy:
+            reason_count["buggy"] += 1
+
+        if candidates_num > 1:
+            reason_count = processed_distribution.setdefault(
+                reason_type, {"total": 0, "buggy": 0}
+            )
+            reason_count["total"] += 1
+            if is_buggy:
+                reason_count["buggy"] += 1
+
+            if is_buggy:
+                rank = index + 1
+                rank_distribution[rank] = rank_distribution.get(rank, 0) + 1
 
     statistic.valid_reports += 1
 
@@ -617,70 +601,141 @@ def _failed_statistic(
     report_name: str, statistic: PreCheckStatistic, e: PreCheckException
 ):
     exception_name = e.__class__.__name__
-    if exception_name not in statistic.invalid_report_exceptions:
-        statistic.invalid_report_exceptions[exception_name] = 0
-
-    statistic.invalid_report_exceptions[exception_name] += 1
+    invalid_report_exceptions = statistic.invalid_report_exceptions
+    invalid_report_exceptions[exception_name] = (
+        invalid_report_exceptions.get(exception_name, 0) + 1
+    )
     statistic.invalid_reports_detail[report_name] = str(e)
 
     statistic.invalid_reports += 1
 
 
 def _save_report(report_name: str, report_info: ReportInfo) -> None:
-    pre_check_report_dir = config.pre_check_reports_dir / report_name
-    pre_check_report_dir.mkdir(parents=True, exist_ok=True)
+    pre_check_report_dir = config.pre_check_report_dir(report_name)
+    pre_check_report_dir.mkdir(exist_ok=True)
 
-    shutil.copy(config.crash_report_path(report_name), pre_check_report_dir)
+    link_or_copy(config.crash_report_path(report_name), pre_check_report_dir)
 
-    with open(config.pre_check_report_info_path(report_name), "w") as f:
-        f.write(report_info.model_dump_json(indent=4))
+    atomic_write_bytes(
+        config.pre_check_report_info_path(report_name),
+        # Serialize straight to JSON, without building the intermediate dicts
+        report_info.model_dump_json(indent=2).encode(),
+    )
 
 
-def main():
-    setup_logging(config.pre_check_dir)
+def _merge_statistic(target, source):
+    """
+    Add the counts of a worker's statistic into `target`: numbers are summed,
+    lists extended, dicts and models merged field by field.
+    """
+    if isinstance(source, BaseModel):
+        for name in type(source).model_fields:
+            setattr(
+                target,
+                name,
+                _merge_statistic(getattr(target, name), getattr(source, name)),
+            )
+        return target
+    if isinstance(source, dict):
+        for key, value in source.items():
+            target[key] = (
+                _merge_statistic(target[key], value) if key in target else value
+            )
+        return target
+    if isinstance(source, list):
+        target.extend(source)
+        return target
+    if isinstance(source, int):
+        return target + source
+    return source
 
-    work_list = config.crash_reports_dir.iterdir()
-    if config.debug:
-        work_list = [
-            report_dir
-            for report_dir in work_list
-            if report_dir.name in config.debug_crash_reports
-        ]
 
-    with logging_redirect_tqdm():
-        for crash_report_dir in tqdm(list(work_list)):
-            report_name = crash_report_dir.name
-            crash_report_path = config.crash_report_path(report_name)
-            if not crash_report_path.exists():
-                logger.error(f"The directory {crash_report_dir} is not a crash report")
-                continue
+def _pre_check_report(report_name: str) -> PreCheckStatistic:
+    """
+    Pre-check and save one crash report in a worker process.
 
-            statistic.total_reports += 1
-            logger.info(f"Pre-checking report {report_name}")
-            logger.debug(f"Crash report directory: {crash_report_dir}")
-            logger.debug(f"Crash report path: {crash_report_path}")
+    The checks record into the module level `statistic`, so every report starts
+    from an empty one, which is sent back and merged by the main process.
+    """
+    global statistic
+    statistic = PreCheckStatistic()
+
+    crash_report_path = config.crash_report_path(report_name)
+    logger.info("Pre-checking report %s", report_name)
+    logger.debug("Crash report path: %s", crash_report_path)
+
+    try:
+        report_info = pre_check(crash_report_path)
+    except PreCheckException as e:
+        logger.exception(e)
+        logger.error("Crash report %s pre-check failed: %s", report_name, e)
+        _failed_statistic(report_name, statistic, e)
+    except Exception as e:
+        logger.exception(e)
+        logger.critical(
+            "Crash report %s pre-check raise unexpected exception", report_name
+        )
+        logger.critical("Crash report path: %s", crash_report_path)
+        raise
+    else:
+        logger.info("Crash report %s pre-check successful", report_name)
+        _save_report(report_name, report_info)
+        _successful_statistic(report_info, statistic)
+    return statistic
 
-            try:
-                report_info = pre_check(crash_report_path)
-            except PreCheckException as e:
-                logger.exception(e)
-                logger.error(f"Crash report {report_name} pre-check failed: {e}")
-                _failed_statistic(report_name, statistic, e)
-            except Exception as e:
-                logger.exception(e)
-                logger.critical(
-                    f"Crash report {report_name} pre-check raise unexpected exception"
-                )
-                logger.critical(f"Crash report path: {crash_report_dir}")
-                exit(1)
-            else:
-                logger.info(f"Crash report {report_name} pre-check successful")
-                _save_report(report_name, report_info)
-                _successful_statistic(report_info, statistic)
 
-    with open(config.pre_check_statistic_path, "w") as f:
-        logger.info(f"Pre-check statistic: {statistic}")
-        f.write(statistic.model_dump_json(indent=4))
+def main():
+    config.pre_check_reports_dir.mkdir(parents=True, exist_ok=True)
+    setup_logging(config.pre_check_dir)
+
+    debug_reports = frozenset(config.debug_crash_reports)
+
+    # Reports are independent and pre-checking is CPU bound, so they are
+    # processed by a pool of worker processes. Each worker returns the
+    # statistic of its report, which is merged here.
+    with ProcessPoolExecutor(
+        max_workers=config.pre_check_max_workers,
+        initializer=setup_worker_logging,
+        initargs=(config.pre_check_dir,),
+    ) as executor:
+        futures: dict[Future[PreCheckStatistic], str] = {}
+        with os.scandir(config.crash_reports_dir) as entries:
+            for crash_report_dir in entries:
+                report_name = crash_report_dir.name
+                if config.debug and report_name not in debug_reports:
+                    continue
+                if not config.crash_report_path(report_name).exists():
+                    logger.error(
+                        "The directory %s is not a crash report", crash_report_dir.path
+                    )
+                    continue
+
+                statistic.total_reports += 1
+                future = executor.submit(_pre_check_report, report_name)
+                futures[future] = report_name
+
+        with logging_redirect_tqdm():
+            for future in tqdm(as_completed(futures), total=len(futures)):
+                try:
+                    future.result()
+                except Exception:
+                    logger.exception(
+                        "Crash report %s pre-check raise unexpected exception",
+                        futures[future],
+                    )
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    exit(1)
+
+    # Merge in submission order, so the statistic does not depend on which
+    # worker finished first
+    for future in futures:
+        _merge_statistic(statistic, future.result())
+
+    logger.info("Pre-check statistic: %s", statistic)
+    atomic_write_bytes(
+        config.pre_check_statistic_path,
+        orjson.dumps(statistic.model_dump(mode="json"), option=orjson.OPT_INDENT_2),
+    )
 
 
 if __name__ == "__main__":
@@ -45,7 +45,7 @@ class Prompt:
                 ```
                 """).strip()
             )
-            return template.substitute(reason=candidate.reasons.reason_explanation())
+            return template.substitute(reason=candidate.reasons.reason_explanation)
 
     @staticmethod
     def _FILTER_CANDIDATE_SYSTEM(constraint: str | None = None) -> str:
@@ -1,11 +1,13 @@
-import shutil
+import os
 from pathlib import Path
 import asyncio
 from crash_locator.config import (
     config,
     setup_logging,
-    run_statistic,
+    get_run_statistic,
+    task_name_var,
 )
+from crash_locator.utils.helper import link_or_copy
 from crash_locator.my_types import (
     ReasonTypeLiteral,
     ReportInfo,
@@ -18,7 +20,6 @@ from crash_locator.my_types import (
 from tqdm import tqdm
 from tqdm.contrib.logging import logging_redirect_tqdm
 import logging
-import json
 import traceback
 
 logger = logging.getLogger(__name__)
@@ -27,55 +28,65 @@ logger = logging.getLogger(__name__)
 def _is_buggy_method_filtered(
     report_info: ReportInfo, remaining_candidates: list[Candidate]
 ) -> bool:
-    for candidate in remaining_candidates:
-        if candidate.signature == report_info.buggy_method:
-            return False
-    return True
+    buggy_method = report_info.buggy_method
+    return not any(
+        candidate.signature == buggy_method for candidate in remaining_candidates
+    )
 
 
 def _get_work_list() -> list[Path]:
-    logger.info(f"Process all reports in {config.pre_check_reports_dir}")
+    logger.info("Process all reports in %s", config.pre_check_reports_dir)
     work_list = []
-    for report_dir in config.pre_check_reports_dir.iterdir():
-        if not report_dir.is_dir():
-            continue
-
+    with os.scandir(config.pre_check_reports_dir) as entries:
+        report_dirs = [entry for entry in entries if entry.is_dir()]
+
+    run_statistic = get_run_statistic()
+    info_name = config.PRE_CHECK_REPORT_INFO_NAME
+    finished_reports = run_statistic.finished_reports_detail
+    debug_reports = frozenset(config.debug_pre_check_reports)
+    for report_dir in report_dirs:
         report_name = report_dir.name
-        report_info_path = config.pre_check_report_info_path(report_name)
-        if not report_info_path.exists():
+        if not os.path.isfile(os.path.join(report_dir.path, info_name)):
             continue
 
-        if config.debug and report_name not in config.debug_pre_check_reports:
+        if config.debug and report_name not in debug_reports:
             continue
 
-        if report_name in run_statistic.finished_reports_detail:
-            finished_report = run_statistic.finished_reports_detail[report_name]
+        finished_report = finished_reports.get(report_name)
+        if finished_report is not None:
             if (not isinstance(finished_report, FailedReportInfo)) or (
                 config.retry_failed_reports is False
             ):
                 continue
             else:
                 run_statistic.remove_report(report_name)
-                logger.info(f"Report {report_name} failed, retry it, ")
+                logger.info("Report %s failed, retry it, ", report_name)
 
-        work_list.append(report_dir)
+        work_list.append(Path(report_dir.path))
 
-    logger.info(f"Found {len(work_list)} reports to process")
-    logger.debug(f"Pending reports: {work_list}")
+    logger.info("Found %s reports to process", len(work_list))
+    logger.debug("Pending reports: %s", work_list)
     return work_list
 
 
+def _load_report_info(report_name: str) -> ReportInfo:
+    return ReportInfo.from_json_bytes(
+        config.pre_check_report_info_path(report_name).read_bytes()
+    )
+
+
 def _copy_report(report_name: str):
     target_dir = config.result_report_dir(report_name)
-    target_dir.mkdir(parents=True, exist_ok=True)
+    # The reports directory is created once by Config.ensure_run_dirs
+    target_dir.mkdir(exist_ok=True)
 
     crash_report = config.crash_report_path(report_name)
-    logger.info(f"Copy `{crash_report}` of {report_name} to {target_dir}")
-    shutil.copy(crash_report, target_dir)
+    logger.info("Link `%s` of %s to %s", crash_report, report_name, target_dir)
+    link_or_copy(crash_report, target_dir)
 
     report_info = config.pre_check_report_info_path(report_name)
-    logger.info(f"Copy `{report_info}` of {report_name} to {target_dir}")
-    shutil.copy(report_info, target_dir)
+    logger.info("Link `%s` of %s to %s", report_info, report_name, target_dir)
+    link_or_copy(report_info, target_dir)
 
 
 class TaskAdapter(logging.LoggerAdapter):
@@ -88,41 +99,44 @@ class TaskAdapter(logging.LoggerAdapter):
         return f"[Task {task_name}] {msg}", kwargs
 
 
+_LIFE_CYCLE_METHODS = frozenset(
+    {"onStart", "onDestroy", "onCreate", "onPause", "onResume"}
+)
+_POSSIBLE_REASON_TYPES = frozenset({ReasonTypeLiteral.NOT_OVERRIDE_METHOD})
+
+
 def _candidate_correction(
     report_info: ReportInfo, retained_candidates: list[Candidate]
 ) -> None:
-    for index, candidate in enumerate(report_info.candidates):
-        if candidate in retained_candidates:
+    # Retained candidates are usually the very objects from report_info, so an
+    # identity check skips most of the field-by-field model comparisons.
+    run_statistic = get_run_statistic()
+    retained_ids = {id(candidate) for candidate in retained_candidates}
+    for candidate in report_info.candidates:
+        if id(candidate) in retained_ids or candidate in retained_candidates:
             continue
 
         keep_reason = None
-        if candidate.signature.method_name in [
-            "onStart",
-            "onDestroy",
-            "onCreate",
-            "onPause",
-            "onResume",
-        ]:
+        if candidate.signature.method_name in _LIFE_CYCLE_METHODS:
             keep_reason = "life cycle"
 
-        if candidate.reasons.reason_type in [
-            ReasonTypeLiteral.NOT_OVERRIDE_METHOD,
-        ]:
+        if candidate.reasons.reason_type in _POSSIBLE_REASON_TYPES:
             keep_reason = "possible reason type"
 
         if keep_reason:
             run_statistic.corrected_candidates += 1
-            if keep_reason not in run_statistic.corrected_candidates_detail:
-                run_statistic.corrected_candidates_detail[keep_reason] = 0
-            run_statistic.corrected_candidates_detail[keep_reason] += 1
+            candidates_detail = run_statistic.corrected_candidates_detail
+            candidates_detail[keep_reason] = candidates_detail.get(keep_reason, 0) + 1
 
             if candidate.signature == report_info.buggy_method:
                 run_statistic.corrected_buggy_method += 1
-                if keep_reason not in run_statistic.corrected_buggy_method_detail:
-                    run_statistic.corrected_buggy_method_detail[keep_reason] = 0
-                run_statistic.corrected_buggy_method_detail[keep_reason] += 1
+                buggy_method_detail = run_statistic.corrected_buggy_method_detail
+                buggy_method_detail[keep_reason] = (
+                    buggy_method_detail.get(keep_reason, 0) + 1
+                )
 
             retained_candidates.append(candidate)
+            retained_ids.add(id(candidate))
 
 
 async def _process_report(
@@ -133,20 +147,20 @@ async def _process_report(
 ):
     from crash_locator.utils.llm import filter_candidate
 
+    task_name_var.set(task_name)
     async with semaphore:
         report_name = pre_check_report_dir.name
-        logger.info(f"Processing report {report_name}")
-        logger.debug(f"Report path: {pre_check_report_dir}")
+        logger.info("Processing report %s", report_name)
+        logger.debug("Report path: %s", pre_check_report_dir)
 
-        with open(config.pre_check_report_info_path(report_name), "r") as f:
-            report_info = ReportInfo(**json.load(f))
+        report_info = await asyncio.to_thread(_load_report_info, report_name)
 
         if len(report_info.candidates) == 1:
-            logger.info(f"Report {report_name} has only one candidate, skip it")
+            logger.info("Report %s has only one candidate, skip it", report_name)
             statistic.add_report(report_name, SkippedReportInfo())
             return
 
-        _copy_report(report_name)
+        await asyncio.to_thread(_copy_report, report_name)
 
         try:
             (
@@ -158,11 +172,11 @@ async def _process_report(
                 _candidate_correction(report_info, retained_candidates)
 
         except asyncio.CancelledError:
-            logger.info(f"Task {task_name} cancelled")
+            logger.info("Task %s cancelled", task_name)
             raise
         except Exception as e:
-            logger.critical(f"Error processing report: {e}")
-            logger.critical(f"{traceback.format_exc()}")
+            logger.critical("Error processing report: %s", e)
+            logger.critical("%s", traceback.format_exc())
             statistic.add_report(
                 task_name,
                 FailedReportInfo(
@@ -185,17 +199,19 @@ async def _process_report(
                     ),
                 ),
             )
-            logger.info(f"Finished processing report {report_name}")
+            logger.info("Finished processing report %s", report_name)
 
 
 async def run():
+    config.ensure_run_dirs()
     setup_logging(config.result_dir)
     logger.info("Start processing reports")
-    logger.info(f"Maximum worker threads: {config.max_workers}")
+    logger.info("Maximum worker threads: %s", config.max_workers)
 
     work_list = _get_work_list()
-    logger.info(f"Found {len(work_list)} reports to process")
+    logger.info("Found %s reports to process", len(work_list))
 
+    run_statistic = get_run_statistic()
     semaphore = asyncio.Semaphore(config.max_workers)
     tasks: list[asyncio.Task] = []
     for report_dir in work_list:
@@ -215,8 +231,13 @@ async def run():
             ):
                 await task
         logger.info("All tasks finished")
-        logger.debug(f"Statistic: {run_statistic}")
+        logger.debug("Statistic: %s", run_statistic)
     except asyncio.CancelledError:
         logger.info("Received CancelledError signal, program will exit")
         for task in tasks:
             task.cancel()
+    finally:
+        from crash_locator.utils.llm import client
+
+        run_statistic.flush()
+        await client.close()
@@ -1,8 +1,16 @@
-from crash_locator.config import config
-from cachier import cachier
+import os
+import sqlite3
+import tempfile
+from contextlib import closing
+from functools import lru_cache
+from pathlib import Path
 
+from crash_locator.config import config
 from crash_locator.my_types import PackageType
 
+# Bump when the layout of the call graph index changes, so old indexes rebuild
+_CG_INDEX_VERSION = 1
+
 
 def _get_cg_file_path(signature, apk_name, android_version):
     from .helper import get_method_type
@@ -23,10 +31,92 @@ def _get_cg_file_path(signature, apk_name, android_version):
     return file_path
 
 
-@cachier()
-def _get_call_methods(signature, apk_name, android_version):
-    from .parser import is_same_signature
+def _normalize_signature(signature: str) -> str:
+    return signature.strip().strip("<>")
+
+
+def _cg_index_path(file_path: Path) -> Path:
+    # Call graph files live in `android_cg/...` or `apk_cg/...`, keep the two
+    # apart in case an apk shares its name with an Android version
+    return (
+        config.cache_dir
+        / "cg_index"
+        / f"{file_path.parent.parent.name}-{file_path.stem}.sqlite"
+    )
+
+
+def _read_edges(file_path: Path):
+    with open(file_path, "r") as lines:
+        for line in lines:
+            caller, callee = line.split("->")
+            yield _normalize_signature(caller), _normalize_signature(callee)
+
+
+def _build_cg_index(file_path: Path, index_path: Path, meta: dict[str, int]):
+    """
+    Write the caller/callee index of a call graph file into a single SQLite
+    file. It is built under a temporary name and moved into place, so other
+    pre-check workers never open a partial index.
+    """
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=index_path.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        with closing(sqlite3.connect(tmp_path)) as conn:
+            conn.execute("PRAGMA journal_mode = OFF")
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.execute(
+                "CREATE TABLE edges (caller TEXT NOT NULL, callee TEXT NOT NULL, "
+                "PRIMARY KEY (caller, callee)) WITHOUT ROWID"
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO edges VALUES (?, ?)", _read_edges(file_path)
+            )
+            conn.execute("CREATE INDEX edges_by_callee ON edges (callee, caller)")
+            conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value INTEGER)")
+            conn.executemany("INSERT INTO meta VALUES (?, ?)", meta.items())
+            conn.commit()
+        os.replace(tmp_path, index_path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def _read_index_meta(conn: sqlite3.Connection) -> dict[str, int] | None:
+    try:
+        return dict(conn.execute("SELECT key, value FROM meta"))
+    except sqlite3.DatabaseError:
+        return None
+
+
+# Connections are cheap and the indexes stay on disk, so a worker only keeps
+# SQLite's page cache of the few most recently used call graphs in memory.
+@lru_cache(maxsize=16)
+def _open_cg_index(file_path: Path) -> sqlite3.Connection:
+    """
+    Open the on-disk index of a call graph file, building it on first use or
+    when the call graph file has changed since the index was built.
+    """
+    index_path = _cg_index_path(file_path)
+    # `as_uri` percent-encodes the path and needs it to be absolute
+    index_uri = f"{index_path.resolve().as_uri()}?mode=ro"
+    source_stat = file_path.stat()
+    meta = {
+        "version": _CG_INDEX_VERSION,
+        "source_mtime_ns": source_stat.st_mtime_ns,
+        "source_size": source_stat.st_size,
+    }
+    if index_path.exists():
+        conn = sqlite3.connect(index_uri, uri=True)
+        if _read_index_meta(conn) == meta:
+            return conn
+        conn.close()
+
+    _build_cg_index(file_path, index_path, meta)
+    return sqlite3.connect(index_uri, uri=True)
 
+
+def _get_call_methods(signature, apk_name, android_version):
     signature = signature.strip("<>")
 
     try:
@@ -36,17 +126,22 @@ def _get_call_methods(signature, apk_name, android_version):
     if not file_path.exists():
         return set(), set()
 
-    called_signature_set = set()
-    caller_signature_set = set()
-    with open(file_path, "r") as lines:
-        for line in lines:
-            caller, callee = line.split("->")
-            if is_same_signature(caller, signature):
-                called_signature_set.add(callee.strip().strip("<>"))
-            if is_same_signature(callee, signature):
-                caller_signature_set.add(caller.strip().strip("<>"))
-
-    return called_signature_set, caller_signature_set
+    conn = _open_cg_index(file_path)
+    signature = _normalize_signature(signature)
+    return (
+        {
+            callee
+            for (callee,) in conn.execute(
+                "SELECT callee FROM edges WHERE caller = ?", (signature,)
+            )
+        },
+        {
+            caller
+            for (caller,) in conn.execute(
+                "SELECT caller FROM edges WHERE callee = ?", (signature,)
+            )
+        },
+    )
 
 
 def get_called_methods(unsafe_signature, apk_name, android_version):
@@ -0,0 +1,22 @@
+import os
+from functools import lru_cache
+from pathlib import Path
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write `data` to `path` so that readers never observe a partial file.
+
+    The bytes are written to a temporary sibling file which then replaces
+    `path` in a single rename.
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+@lru_cache(maxsize=4096)
+def ensure_dir(path: Path) -> Path:
+    """Create `path` and its parents once per process and return it."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
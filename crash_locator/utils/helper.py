@@ -1,23 +1,37 @@
-from crash_locator.my_types import PackageType
+import logging
+import os
+import shutil
+from pathlib import Path
 
+from crash_locator.my_types import PackageType, parse_method_signature
+
+logger = logging.getLogger(__name__)
 
-def get_method_type(method_signature):
-    from .parser import parse_signature
 
-    package_name, _, _, _, _, _ = parse_signature(method_signature)
-    if package_name.startswith("java"):
-        return PackageType.JAVA
-    elif package_name.startswith("android.support"):
-        return PackageType.ANDROID_SUPPORT
-    elif package_name.startswith("android") or package_name.startswith("com.android"):
-        return PackageType.ANDROID
-    else:
-        return PackageType.APPLICATION
+def get_method_type(method_signature):
+    package_name = parse_method_signature(method_signature).package_name
+    return PackageType.from_package_name(package_name)
 
 
 def method_signature_into_path(method_signature):
-    from .parser import parse_signature
-
-    package_name, class_name, _, _, _, _ = parse_signature(method_signature)
+    parsed = parse_method_signature(method_signature)
+    package_name, class_name = parsed.package_name, parsed.class_name
     path = package_name.replace(".", "/") + "/" + class_name + ".java"
     return path
+
+
+def link_or_copy(src: Path, target_dir: Path) -> Path:
+    """Hard link `src` into `target_dir`, falling back to a copy.
+
+    The linked files are read-only snapshots, so sharing the inode avoids
+    duplicating the bytes on disk. Cross-device targets or filesystems without
+    hard link support fall back to `shutil.copy`.
+    """
+    target = target_dir / src.name
+    target.unlink(missing_ok=True)
+    try:
+        os.link(src, target)
+    except OSError as e:
+        logger.debug("Hard link `%s` to `%s` failed, copy it: %s", src, target, e)
+        shutil.copy(src, target)
+    return target
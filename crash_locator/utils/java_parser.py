@@ -1,7 +1,8 @@
-from tree_sitter import Language, Parser, Node
+from tree_sitter import Language, Parser, Node, Query, Tree
 from typing import Callable
+from functools import lru_cache
 import tree_sitter_java
-from pathlib import Path
+import os
 from crash_locator.config import config
 from crash_locator.my_types import (
     MethodSignature,
@@ -63,13 +64,15 @@ def get_candidate_code(
             parameters=candidate.signature.parameters,
             return_type=candidate.signature.return_type,
         )
-        try:
-            return _get_method_code_in_file(
-                config.application_code_dir(apk_name) / method_signature.into_path(),
-                method_signature,
-            )
-        except NoMethodFoundCodeError:
-            continue
+        method_code = _find_method_code_in_file(
+            os.path.join(
+                config.application_code_dir_str(apk_name),
+                method_signature.into_path(),
+            ),
+            method_signature,
+        )
+        if method_code is not None:
+            return method_code
 
     raise NoMethodFoundCodeError()
 
@@ -80,7 +83,9 @@ def get_application_code(
 ) -> str:
     """Get the application code for a given method signature."""
     return _get_method_code_in_file(
-        config.application_code_dir(apk_name) / method_signature.into_path(),
+        os.path.join(
+            config.application_code_dir_str(apk_name), method_signature.into_path()
+        ),
         method_signature,
     )
 
@@ -98,7 +103,9 @@ def get_framework_code(
     """
     if method_signature.package_name.startswith("android.support"):
         return _get_method_code_in_file(
-            config.android_support_code_dir() / method_signature.into_path(),
+            os.path.join(
+                config.android_support_code_dir_str(), method_signature.into_path()
+            ),
             method_signature,
         )
     else:
@@ -113,12 +120,15 @@ def get_framework_code(
                 inner_class=None,
                 method_name=method_signature.method_name,
                 return_type=method_signature.return_type,
-                parameters=method_signature.parameters,
+                parameters=[
+                    *method_signature.parameters[:3],
+                    "android.location.LocationListener",
+                    *method_signature.parameters[4:],
+                ],
             )
-            method_signature.parameters[3] = "android.location.LocationListener"
-        for android_code_dir in config.android_code_dir(android_version):
-            code_path = android_code_dir / method_signature.into_path()
-            if code_path.exists():
+        for android_code_dir in config.android_code_dir_str(android_version):
+            code_path = os.path.join(android_code_dir, method_signature.into_path())
+            if os.path.exists(code_path):
                 return _get_method_code_in_file(code_path, method_signature)
 
         raise CodeFileNotFoundException()
@@ -129,12 +139,12 @@ def list_application_methods(
     class_signature: ClassSignature,
 ) -> list[str]:
     """List all methods in a given class."""
-    code_path = config.application_code_dir(apk_name) / class_signature.into_path()
-    if not code_path.exists():
+    code_path = os.path.join(
+        config.application_code_dir_str(apk_name), class_signature.into_path()
+    )
+    if not os.path.exists(code_path):
         raise CodeFileNotFoundException()
-    with open(code_path, "r", encoding="utf-8") as f:
-        code_bytes = f.read().encode("utf-8")
-    tree = parser.parse(code_bytes)
+    code_bytes, tree = _parse_code_file(code_path)
 
     query_string = f"""
     (
@@ -167,12 +177,12 @@ def list_application_fields(
     class_signature: ClassSignature,
 ) -> list[str]:
     """List all fields in a given class."""
-    code_path = config.application_code_dir(apk_name) / class_signature.into_path()
-    if not code_path.exists():
+    code_path = os.path.join(
+        config.application_code_dir_str(apk_name), class_signature.into_path()
+    )
+    if not os.path.exists(code_path):
         raise CodeFileNotFoundException()
-    with open(code_path, "r", encoding="utf-8") as f:
-        code_bytes = f.read().encode("utf-8")
-    tree = parser.parse(code_bytes)
+    code_bytes, tree = _parse_code_file(code_path)
 
     field_nodes = _get_all_fields_in_class(tree.root_node, class_signature.class_name)
     field_strings = [
@@ -188,12 +198,12 @@ def get_application_field(
     field_name: str,
 ) -> str:
     """Get the application code for a given field name."""
-    code_path = config.application_code_dir(apk_name) / class_signature.into_path()
-    if not code_path.exists():
+    code_path = os.path.join(
+        config.application_code_dir_str(apk_name), class_signature.into_path()
+    )
+    if not os.path.exists(code_path):
         raise CodeFileNotFoundException()
-    with open(code_path, "r", encoding="utf-8") as f:
-        code_bytes = f.read().encode("utf-8")
-    tree = parser.parse(code_bytes)
+    code_bytes, tree = _parse_code_file(code_path)
     field_nodes = _get_all_fields_in_class(tree.root_node, class_signature.class_name)
     for field_node in field_nodes:
         variable_declarator = get_child(field_node, "variable_declarator")
@@ -229,6 +239,30 @@ def get_application_strings(
         return f.read()
 
 
+@lru_cache(maxsize=256)
+def _parse_code_file(code_path: str) -> tuple[bytes, Tree]:
+    """Read and parse a java source file.
+
+    Source files are not modified during a run, so the parsed tree is cached
+    and shared by every lookup into the same file.
+    """
+    with open(code_path, "r", encoding="utf-8") as f:
+        code_bytes = f.read().encode("utf-8")
+    return code_bytes, parser.parse(code_bytes)
+
+
+@lru_cache(maxsize=1024)
+def _method_query(method_name: str) -> Query:
+    query_string = f"""
+    (
+        method_declaration
+        (identifier) @name (#eq? @name "{method_name}")
+        (formal_parameters)
+    ) @method"""
+
+    return JAVA_LANGUAGE.query(query_string)
+
+
 def _field_node_to_signature_string(field_node: Node, code_bytes: bytes) -> str:
     start_byte_index = field_node.start_byte
     end_byte_index = field_node.end_byte
@@ -278,33 +312,41 @@ def _method_node_to_signature_string(method_node: Node, code_bytes: bytes) -> st
     return method_code.decode("utf-8")
 
 
+_NATIVE_START_MAIN = MethodSignature.from_str("dalvik.system.NativeStart.main")
+
+
 def _get_method_code_in_file(
-    file_path: Path,
+    file_path: str,
     method_signature: MethodSignature,
 ) -> str:
-    logger.debug(f"Getting method code in file: {file_path}")
+    method_code = _find_method_code_in_file(file_path, method_signature)
+    if method_code is None:
+        raise NoMethodFoundCodeError()
+    return method_code
+
+
+def _find_method_code_in_file(
+    file_path: str,
+    method_signature: MethodSignature,
+) -> str | None:
+    """Like `_get_method_code_in_file`, but returns None when no method matches.
+
+    Searching the extend hierarchy misses in most classes, so the lookup loop
+    uses this variant instead of raising and catching an exception per class.
+    """
+    logger.debug("Getting method code in file: %s", file_path)
     # TODO: handle <init> method
     method_name = method_signature.method_name
 
-    if method_signature == MethodSignature.from_str("dalvik.system.NativeStart.main"):
+    if method_signature == _NATIVE_START_MAIN:
         return "This is a android native method, you can not get the code of it"
 
-    if not file_path.exists():
+    if not os.path.exists(file_path):
         raise CodeFileNotFoundException()
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        code_bytes = f.read().encode("utf-8")
-    tree = parser.parse(code_bytes)
+    code_bytes, tree = _parse_code_file(file_path)
 
-    query_string = f"""
-    (
-        method_declaration
-        (identifier) @name (#eq? @name "{method_name}")
-        (formal_parameters)
-    ) @method"""
-
-    query = JAVA_LANGUAGE.query(query_string)
-    captures = query.captures(tree.root_node)
+    captures = _method_query(method_name).captures(tree.root_node)
 
     method = _filter_methods(
         captures.get("method"),
@@ -317,7 +359,7 @@ def _get_method_code_in_file(
         ],
     )
     if method is None or len(method) == 0:
-        raise NoMethodFoundCodeError()
+        return None
     elif len(method) > 1:
         codes = []
         for method_node in method:
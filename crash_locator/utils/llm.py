@@ -1,7 +1,7 @@
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from openai import RateLimitError, InternalServerError, APIConnectionError
 from openai._types import NOT_GIVEN
-from crash_locator.config import config, run_statistic
+from crash_locator.config import config, get_run_statistic
 from crash_locator.my_types import (
     ReportInfo,
     Candidate,
@@ -9,6 +9,7 @@ from crash_locator.my_types import (
     ClassSignature,
     ReasonTypeLiteral,
     ManualSupplementReason,
+    CANDIDATE_LIST_ADAPTER,
 )
 from crash_locator.prompt import Prompt
 from crash_locator.exceptions import (
@@ -20,6 +21,7 @@ from crash_locator.exceptions import (
 from crash_locator.my_types import PackageType
 from crash_locator.utils.helper import get_method_type
 from crash_locator.utils.java_parser import get_framework_code
+from crash_locator.utils.fs import ensure_dir
 from crash_locator.types.llm import (
     Conversation,
     Message,
@@ -29,7 +31,9 @@ from crash_locator.types.llm import (
     TokenUsage,
 )
 from typing import Callable
-import json
+import asyncio
+import httpx
+import orjson
 from pathlib import Path
 from tenacity import (
     retry,
@@ -46,7 +50,19 @@ from textwrap import dedent
 
 logger = logging.getLogger(__name__)
 
-client = AsyncOpenAI(base_url=config.openai_base_url, api_key=config.openai_api_key)
+# One pooled client for the whole run, sized to the number of concurrent requests
+# so that every in-flight request can reuse a kept-alive connection.
+client = AsyncOpenAI(
+    base_url=config.openai_base_url,
+    api_key=config.openai_api_key,
+    http_client=DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=config.max_llm_requests,
+            max_keepalive_connections=config.max_llm_requests,
+        )
+    ),
+)
+request_semaphore = asyncio.Semaphore(config.max_llm_requests)
 
 
 tools: list[ChatCompletionToolParam] = [
@@ -196,7 +212,7 @@ async def _query_response_api(conversation: Conversation) -> Response:
         timeout=240,
         stream=False,
     )
-    logger.debug(f"Raw response: {response}")
+    logger.debug("Raw response: %s", response)
 
     content = response.output_text
     token_usage = TokenUsage(
@@ -223,7 +239,7 @@ async def _query_completion_api(
         else NOT_GIVEN,
         tools=tools if tools is not None else NOT_GIVEN,
     )
-    logger.debug(f"Raw response: {response}")
+    logger.debug("Raw response: %s", response)
 
     content = response.choices[0].message.content
     tool_calls = response.choices[0].message.tool_calls
@@ -272,27 +288,28 @@ async def _query_llm(
     tools: list[ChatCompletionToolParam] | None = None,
 ) -> Conversation:
     logger.info("Preparing to query LLM")
-    logger.debug(f"Messages: {conversation}")
+    logger.debug("Messages: %s", conversation)
 
     conversation = conversation.messages_copy()
-    match config.openai_api_type:
-        case APIType.RESPONSE:
-            logger.info("Using response API")
-            response = await _query_response_api(conversation)
-        case APIType.COMPLETION:
-            logger.info("Using completion API")
-            response = await _query_completion_api(conversation, tools)
-        case _:
-            raise ValueError(f"Invalid API type: {config.openai_api_type}")
+    async with request_semaphore:
+        match config.openai_api_type:
+            case APIType.RESPONSE:
+                logger.info("Using response API")
+                response = await _query_response_api(conversation)
+            case APIType.COMPLETION:
+                logger.info("Using completion API")
+                response = await _query_completion_api(conversation, tools)
+            case _:
+                raise ValueError(f"Invalid API type: {config.openai_api_type}")
 
     content = response.content
     tool_calls = response.tool_calls
     token_usage = response.token_usage
     reasoning_content = response.reasoning_content
-    run_statistic.add_token_usage(token_usage)
+    get_run_statistic().add_token_usage(token_usage)
     logger.info("LLM query completed")
-    logger.debug(f"Content: {content}")
-    logger.debug(f"Token usage: {token_usage}")
+    logger.debug("Content: %s", content)
+    logger.debug("Token usage: %s", token_usage)
 
     conversation.append(
         Message(
@@ -311,12 +328,12 @@ async def _query_llm_with_retry(
     retry_times: int,
     validate_func: Callable[[str], bool],
 ):
-    logger.info(f"Query LLM with retry {retry_times} times")
+    logger.info("Query LLM with retry %s times", retry_times)
 
     first_times = True
     for times in range(retry_times + 1):
         if not first_times:
-            logger.info(f"Retry {times} / {retry_times}")
+            logger.info("Retry %s / %s", times, retry_times)
         else:
             first_times = False
 
@@ -327,18 +344,21 @@ async def _query_llm_with_retry(
             logger.info("Get valid response from LLM")
             return new_conversation
 
-        logger.error(f"Get unexpected response from LLM: {content}")
+        logger.error("Get unexpected response from LLM: %s", content)
 
     raise UnExpectedResponseException("Invalid response from LLM")
 
 
 def _save_conversation(conversation: Conversation, base_dir: Path, name: str):
-    dir = base_dir / "conversation"
-    dir.mkdir(parents=True, exist_ok=True)
-    logger.info(f"Saving conversation to {dir}")
+    dir = ensure_dir(base_dir / "conversation")
+    logger.info("Saving conversation to %s", dir)
 
-    with open(dir / f"{name}.json", "w") as f:
-        json.dump(conversation.model_dump(), f, indent=4)
+    with open(dir / f"{name}.json", "wb") as f:
+        f.write(
+            orjson.dumps(
+                conversation.model_dump(mode="json"), option=orjson.OPT_INDENT_2
+            )
+        )
     with open(dir / f"{name}.md", "w") as f:
         for message in conversation.messages:
             f.write(f"## {message.role}\n")
@@ -358,15 +378,11 @@ def _save_conversation(conversation: Conversation, base_dir: Path, name: str):
 
 
 def _save_retained_candidates(candidates: list[Candidate], dir: Path):
-    logger.info(f"Saving retained candidates to {dir}")
-
-    dir.mkdir(parents=True, exist_ok=True)
-    with open(dir / "retained_candidates.json", "w") as f:
-        json.dump(
-            [candidate.model_dump() for candidate in candidates],
-            f,
-            indent=4,
-        )
+    logger.info("Saving retained candidates to %s", dir)
+
+    ensure_dir(dir)
+    with open(dir / "retained_candidates.json", "wb") as f:
+        f.write(CANDIDATE_LIST_ADAPTER.dump_json(candidates, indent=2))
 
 
 def _evaluate_candidate_function_factory(
@@ -462,9 +478,9 @@ def _call_tool_factory(
 
     def call_tool(tool_name: str, tool_args: dict) -> str:
         try:
-            if tool_name not in run_statistic.tool_calling_detail:
-                run_statistic.tool_calling_detail[tool_name] = 0
-            run_statistic.tool_calling_detail[tool_name] += 1
+            run_statistic = get_run_statistic()
+            tool_calling_detail = run_statistic.tool_calling_detail
+            tool_calling_detail[tool_name] = tool_calling_detail.get(tool_name, 0) + 1
 
             match tool_name:
                 case "evaluate_candidate":
@@ -534,13 +550,13 @@ async def _query_llm_with_tool_process(
                 if tool_name == end_tool_call_name:
                     is_end = True
 
-                tool_args = json.loads(tool_call["function"]["arguments"])
-                logger.info(f"Tool call: {tool_name} with args: {tool_args}")
+                tool_args = orjson.loads(tool_call["function"]["arguments"])
+                logger.info("Tool call: %s with args: %s", tool_name, tool_args)
 
                 tool_call_id = tool_call["id"]
                 tool_result = tool_func(tool_name, tool_args)
                 logger.info("Got tool result")
-                logger.debug(f"Tool result: {tool_result}")
+                logger.debug("Tool result: %s", tool_result)
                 conversation.append(
                     Message(
                         content=tool_result, role=Role.TOOL, tool_call_id=tool_call_id
@@ -553,16 +569,15 @@ async def _query_base_candidates(
     report_info: ReportInfo,
     constraint: str | None = None,
 ) -> tuple[list[Candidate], Conversation]:
-    logger.info(f"Starting base candidate query for {report_info.apk_name}")
+    logger.info("Starting base candidate query for %s", report_info.apk_name)
 
     conversation = Prompt.base_filter_candidate_prompt(report_info, constraint)
 
     retained_candidates = []
-    for index, candidate in enumerate(report_info.base_candidates):
-        logger.info(
-            f"Querying base candidate {index + 1} / {len(report_info.base_candidates)}"
-        )
-        logger.info(f"Candidate: {candidate.name}")
+    base_candidates = report_info.base_candidates
+    for index, candidate in enumerate(base_candidates):
+        logger.info("Querying base candidate %s / %s", index + 1, len(base_candidates))
+        logger.info("Candidate: %s", candidate.name)
 
         conversation.append(
             Message(
@@ -584,36 +599,90 @@ async def _query_base_candidates(
     return retained_candidates, conversation
 
 
-async def _query_extra_candidates(
+async def _query_extra_candidate(
     report_info: ReportInfo,
     retained_candidates: list[Candidate],
     base_messages: Conversation,
+    candidate: Candidate,
+    index: int,
+    total: int,
 ) -> list[Candidate]:
-    logger.info(f"Starting extra candidate query for {report_info.apk_name}")
-
-    for index, candidate in enumerate(report_info.extra_candidates):
-        logger.info(
-            f"Querying extra candidate {index + 1} / {len(report_info.extra_candidates)}"
-        )
-        logger.info(f"Candidate: {candidate.name}")
-        conversation = base_messages.messages_copy()
-        conversation.append(
-            Message(
-                content=Prompt.FILTER_CANDIDATE_METHOD(report_info, candidate),
-                role=Role.USER,
-            )
-        )
-        conversation = await _query_llm_with_tool_process(
-            conversation,
-            _call_tool_factory(report_info.apk_name, retained_candidates, candidate),
-            "evaluate_candidate",
+    """Evaluate one extra candidate in its own branch of the base conversation.
+
+    Returns:
+        The candidates retained in this branch, excluding `retained_candidates`.
+    """
+    logger.info("Querying extra candidate %s / %s", index + 1, total)
+    logger.info("Candidate: %s", candidate.name)
+    branch_candidates = retained_candidates.copy()
+    conversation = base_messages.messages_copy()
+    conversation.append(
+        Message(
+            content=Prompt.FILTER_CANDIDATE_METHOD(report_info, candidate),
+            role=Role.USER,
         )
+    )
+    conversation = await _query_llm_with_tool_process(
+        conversation,
+        _call_tool_factory(report_info.apk_name, branch_candidates, candidate),
+        "evaluate_candidate",
+    )
 
-        _save_conversation(
-            conversation,
-            config.result_report_filter_dir(report_info.apk_name),
-            f"extra_candidates_{index + 1}",
+    _save_conversation(
+        conversation,
+        config.result_report_filter_dir(report_info.apk_name),
+        f"extra_candidates_{index + 1}",
+    )
+    return branch_candidates[len(retained_candidates) :]
+
+
+async def _query_extra_candidates(
+    report_info: ReportInfo,
+    retained_candidates: list[Candidate],
+    base_messages: Conversation,
+) -> list[Candidate]:
+    logger.info("Starting extra candidate query for %s", report_info.apk_name)
+
+    # Extra candidates are independent of each other, so query them concurrently
+    # and merge the results in candidate order. Each branch only sees the base
+    # `retained_candidates`, so the "already in the list" reply of
+    # `add_buggy_method_candidate` does not cover candidates added by sibling
+    # branches. Manual supplements found by several branches are deduplicated in
+    # the merge below.
+    extra_candidates = report_info.extra_candidates
+    tasks = [
+        asyncio.create_task(
+            _query_extra_candidate(
+                report_info,
+                retained_candidates,
+                base_messages,
+                candidate,
+                index,
+                len(extra_candidates),
+            )
         )
+        for index, candidate in enumerate(extra_candidates)
+    ]
+    try:
+        branches = await asyncio.gather(*tasks)
+    except BaseException:
+        # The report has failed, stop the sibling branches from sending further
+        # requests and writing conversations into its result directory.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    for branch_candidates in branches:
+        for candidate in branch_candidates:
+            if (
+                candidate.reasons.reason_type == ReasonTypeLiteral.MANUAL_SUPPLEMENT
+                and any(
+                    retained.signature == candidate.signature
+                    for retained in retained_candidates
+                )
+            ):
+                continue
+            retained_candidates.append(candidate)
 
     return retained_candidates
 
@@ -623,7 +692,7 @@ async def _query_final_review(
     retained_candidates: list[Candidate],
     base_messages: Conversation,
 ) -> list[Candidate]:
-    logger.info(f"Starting final review for {report_info.apk_name}")
+    logger.info("Starting final review for %s", report_info.apk_name)
 
     conversation = base_messages.messages_copy()
 
@@ -650,7 +719,7 @@ async def _query_final_review(
 async def _llm_filter_candidate(
     report_info: ReportInfo, constraint: str | None = None
 ) -> tuple[list[Candidate], list[Candidate]]:
-    logger.info(f"Starting llm candidate filtering for {report_info.apk_name}")
+    logger.info("Starting llm candidate filtering for %s", report_info.apk_name)
 
     retained_candidates, base_messages = await _query_base_candidates(
         report_info, constraint
@@ -668,7 +737,9 @@ async def _llm_filter_candidate(
         config.result_report_filter_dir(report_info.apk_name),
     )
     logger.info(
-        f"Candidate filtering completed, before: {len(report_info.candidates)}, after: {len(retained_candidates)}"
+        "Candidate filtering completed, before: %s, after: %s",
+        len(report_info.candidates),
+        len(retained_candidates),
     )
     return retained_candidates_before_final_review, retained_candidates
 
@@ -748,21 +819,23 @@ async def _infer_constraint(
 async def _construct_constraint(report_info: ReportInfo) -> str:
     inference_messages = Prompt.base_inferrer_prompt()
     for index, framework_method in enumerate(report_info.framework_trace):
-        logger.info(f"construct constraint for {framework_method}")
+        logger.info("construct constraint for %s", framework_method)
         logger.info(
-            f"Constraint construction process: {index + 1} / {len(report_info.framework_trace)}"
+            "Constraint construction process: %s / %s",
+            index + 1,
+            len(report_info.framework_trace),
         )
 
         if index == 0:
-            logger.info(f"Extracting constraint for {framework_method}")
+            logger.info("Extracting constraint for %s", framework_method)
             constraint = await _extract_constraint(framework_method, report_info)
         else:
-            logger.info(f"Inferring constraint for {framework_method}")
+            logger.info("Inferring constraint for %s", framework_method)
             constraint = await _infer_constraint(
                 framework_method, inference_messages, constraint, report_info
             )
 
-    logger.info(f"Constraint is extracted: {constraint}")
+    logger.info("Constraint is extracted: %s", constraint)
     with open(
         config.result_report_constraint_dir(report_info.apk_name) / "constraint.txt",
         "w",
@@ -775,7 +848,7 @@ async def _construct_constraint(report_info: ReportInfo) -> str:
 async def filter_candidate(
     report_info: ReportInfo,
 ) -> tuple[list[Candidate], list[Candidate]]:
-    logger.info(f"Starting candidate filtering for {report_info.apk_name}")
+    logger.info("Starting candidate filtering for %s", report_info.apk_name)
 
     constraint = None
     if config.enable_extract_constraint:
@@ -1,5 +1,7 @@
 import re
-from crash_locator.exceptions import InvalidSignatureException
+from crash_locator.my_types import parse_method_signature
+
+_FIELD_SIG_PATTERN = re.compile(r"(\S+)\.(\w+)(\$\S+)?: (\S+) (\w+)")
 
 
 def parse_signature(method_signature):
@@ -12,54 +14,15 @@ def parse_signature(method_signature):
     Counter Example:
     1. <android.view.View: void invalidate(android.graphics.Rect)>; <android.view.View: void invalidate(int,int,int,int)>; <android.view.View: void invalidate()>
     """
-    method_signature = method_signature.strip().strip("<>")
-    pattern1 = r"^(\S+)\.(\w+)(\$\S+)?: (\S+) ([\w$]+|<init>)(\([^()]*?\))?$"
-    pattern2 = r"^(\S+)\.(\w+)(\$\S+)?\.(\S+)$"
-    match1 = re.match(pattern1, method_signature)
-    match2 = re.match(pattern2, method_signature)
-    if match1:
-        (
-            package_name,
-            class_name,
-            inner_class,
-            return_type,
-            method_name,
-            parameter_list,
-        ) = match1.groups()
-        if inner_class:
-            inner_class = inner_class.strip("$")
-        if parameter_list:
-            parameters = [
-                param.strip() for param in parameter_list.strip("()").split(",")
-            ]
-            # remove empty string
-            parameters = list(filter(None, parameters))
-        else:
-            parameters = None
-
-        return (
-            package_name,
-            class_name,
-            inner_class,
-            return_type,
-            method_name,
-            parameters,
-        )
-    elif match2:
-        package_name, class_name, inner_class, method_name = match2.groups()
-        if inner_class:
-            inner_class = inner_class.strip("$")
-        return package_name, class_name, inner_class, None, method_name, None
-    else:
-        raise InvalidSignatureException(f"Invalid signature: {method_signature}")
-
-
-def is_same_signature(signature1, signature2):
-    if signature1 == signature2:
-        return True
-    if signature1.strip().strip("<>") == signature2.strip().strip("<>"):
-        return True
-    return False
+    parsed = parse_method_signature(method_signature)
+    return (
+        parsed.package_name,
+        parsed.class_name,
+        parsed.inner_class,
+        parsed.return_type,
+        parsed.method_name,
+        list(parsed.parameters) if parsed.parameters is not None else None,
+    )
 
 
 def parse_field_signature(field_signature):
@@ -70,8 +33,7 @@ def parse_field_signature(field_signature):
         1. android.view.ViewRoot$InnerClass: java.lang.Thread mThread
     """
     field_signature = field_signature.strip().strip("<>")
-    pattern = r"(\S+)\.(\w+)(\$\S+)?: (\S+) (\w+)"
-    match = re.match(pattern, field_signature)
+    match = _FIELD_SIG_PATTERN.match(field_signature)
     if match:
         package_name, class_name, inner_class, type_name, field_name = match.groups()
         if inner_class: